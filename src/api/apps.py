@@ -6,7 +6,11 @@ class ApiConfig(AppConfig):
     name = "src.api"
 
     def ready(self) -> None:
+        from django.db.backends.signals import connection_created
+
         from src.utils.svcs import init_registry, close_registry
+        from src.config.databases.router import track_writes
 
         init_registry(self)
         close_registry(self)
+        connection_created.connect(track_writes, dispatch_uid="track_writes")
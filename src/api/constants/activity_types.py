@@ -6,11 +6,16 @@ class ActivityTypes(TypedDict):
     USER_REGISTRATION: str
     SEND_OTP: str
     VALIDATE_OTP: str
+    PURGE_OTPS: str
     RESEND_EMAIL: str
     EMAIL_VALIDATION: str
     USER_LOGIN: str
     VALIDATE_TOKEN: str
+    REVOKE_TOKEN: str
+    REFRESH_TOKEN: str
+    USER_LOGOUT: str
     CHANGE_PASSWORD: str
+    LIST_USERS: str
     REQUEST_RESET_PASSWORD: str
     CONFIRM_RESET_PASSWORD: str
 
@@ -20,11 +25,16 @@ ACTIVITY_TYPES: ActivityTypes = {
     "USER_REGISTRATION": "User registration",
     "SEND_OTP": "Send OTP",
     "VALIDATE_OTP": "Validate OTP",
+    "PURGE_OTPS": "Purge expired OTPs",
     "RESEND_EMAIL": "Resend email validation",
     "EMAIL_VALIDATION": "Email validation",
     "USER_LOGIN": "User login",
     "VALIDATE_TOKEN": "Validate token",
+    "REVOKE_TOKEN": "Revoke token",
+    "REFRESH_TOKEN": "Refresh token",
+    "USER_LOGOUT": "User logout",
     "CHANGE_PASSWORD": "Change user password",
+    "LIST_USERS": "List users",
     "REQUEST_RESET_PASSWORD": "Request for password reset",
     "CONFIRM_RESET_PASSWORD": "Confirm password reset",
 }
@@ -19,6 +19,11 @@ class AuthMessages(TypedDict):
     SUCCESS: str
     TOKEN_ERROR: str
     TOKEN_SUCCESS: str
+    TOKENS_VALIDATED: str
+    TOKEN_REVOKED: str
+    TOKEN_REFRESHED: str
+    LOGGED_OUT: str
+    LOGGED_OUT_ALL: str
 
 
 class OtpMessages(TypedDict):
@@ -26,6 +31,7 @@ class OtpMessages(TypedDict):
     VALIDATE_SUCCESS: str
     VALIDATE_FAIL: str
     USER_VALIDATED: str
+    PURGED: str
 
 
 class UserMessages(TypedDict):
@@ -33,12 +39,15 @@ class UserMessages(TypedDict):
     SANITIZED: str
     INCORRECT_PASSWORD: str
     PASSWORD_CHANGED: str
+    PASSWORD_REHASHED: str
+    INVALID_CURSOR: str
 
 
 class CommonMessages(TypedDict):
     INTERNAL_SERVER_ERROR: str
     JWT_GENERATED: str
     VALIDATION_ERROR: str
+    SERVER_BUSY: str
 
 
 class PasswordResetMessages(TypedDict):
@@ -98,23 +107,32 @@ MESSAGES: Messages = {
         "SUCCESS": "Successfully logged in",
         "TOKEN_ERROR": "Invalid token",
         "TOKEN_SUCCESS": "Valid token",
+        "TOKENS_VALIDATED": "Tokens validated",
+        "TOKEN_REVOKED": "Token revoked",
+        "TOKEN_REFRESHED": "Token refreshed",
+        "LOGGED_OUT": "Successfully logged out",
+        "LOGGED_OUT_ALL": "Successfully logged out of all sessions",
     },
     "OTP": {
         "SEND_SUCCESS": "OTP sent successfully",
         "USER_VALIDATED": "User is already validated",
         "VALIDATE_SUCCESS": "OTP validation was successful",
         "VALIDATE_FAIL": "OTP validation failed",
+        "PURGED": "Expired OTPs purged",
     },
     "USER": {
         "DOESNT_EXIST": "User doesn't exist",
         "SANITIZED": "User object was sanitized",
         "INCORRECT_PASSWORD": "Incorrect old password",
         "PASSWORD_CHANGED": "Password changed successfully",
+        "PASSWORD_REHASHED": "Password hash upgraded to the current hashing policy",
+        "INVALID_CURSOR": "Invalid pagination cursor",
     },
     "COMMON": {
         "INTERNAL_SERVER_ERROR": "Something went wrong",
         "JWT_GENERATED": "JWT was generated",
         "VALIDATION_ERROR": "Validation errors",
+        "SERVER_BUSY": "Server is busy. Please try again shortly",
     },
     "PASSWORD_RESET": {
         "EMAIL_SENT": "Password reset email sent successfully to your email",
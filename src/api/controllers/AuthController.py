@@ -6,7 +6,7 @@ from src.utils.logger import Logger
 from src.api.constants.messages import MESSAGES
 from src.api.services.AuthService import AuthService
 from src.api.utils.response_format import error_response, success_response
-from src.api.models.payload.requests.JWT import JWT
+from src.api.models.payload.requests.JWT import JWT, BatchJWT, RefreshToken
 from src.api.models.payload.requests.ResendUserOtp import ResendUserOtp
 from src.api.models.payload.requests.CreateUserRequest import CreateUserRequest
 from src.api.models.payload.requests.AuthenticateUserOtp import AuthenticateUserOtp
@@ -68,7 +68,11 @@ class AuthController:
             )
         return success_response(
             message=auth_user["message"],
-            data={"user": auth_user["user"], "token": auth_user["token"]},
+            data={
+                "user": auth_user["user"],
+                "token": auth_user["token"],
+                "refresh_token": auth_user["refresh_token"],
+            },
             status_code=HTTPStatus.OK,
         )
 
@@ -84,6 +88,55 @@ class AuthController:
             status_code=HTTPStatus.OK,
         )
 
+    async def revoke_token(self, credentials: JWT) -> tuple:
+        revoked = await self.auth_service.revoke_token(credentials)
+        if not revoked["is_success"]:
+            return error_response(
+                message=revoked["message"], status_code=HTTPStatus.BAD_REQUEST
+            )
+        return success_response(message=revoked["message"], status_code=HTTPStatus.OK)
+
+    async def refresh_token(self, credentials: RefreshToken) -> tuple:
+        session = await self.auth_service.refresh_token(credentials)
+        if not session:
+            return error_response(
+                message=MESSAGES["AUTH"]["TOKEN_ERROR"],
+                status_code=HTTPStatus.UNAUTHORIZED,
+            )
+        return success_response(
+            message=MESSAGES["AUTH"]["TOKEN_REFRESHED"],
+            data=session,
+            status_code=HTTPStatus.OK,
+        )
+
+    async def logout(self, credentials: RefreshToken) -> tuple:
+        logged_out = await self.auth_service.logout(credentials)
+        if not logged_out["is_success"]:
+            return error_response(
+                message=logged_out["message"], status_code=HTTPStatus.UNAUTHORIZED
+            )
+        return success_response(
+            message=logged_out["message"], status_code=HTTPStatus.OK
+        )
+
+    async def logout_all(self, credentials: RefreshToken) -> tuple:
+        logged_out = await self.auth_service.logout_all(credentials)
+        if not logged_out["is_success"]:
+            return error_response(
+                message=logged_out["message"], status_code=HTTPStatus.UNAUTHORIZED
+            )
+        return success_response(
+            message=logged_out["message"], status_code=HTTPStatus.OK
+        )
+
+    async def validate_tokens(self, credentials: BatchJWT) -> tuple:
+        results = await self.auth_service.validate_tokens(credentials)
+        return success_response(
+            message=MESSAGES["AUTH"]["TOKENS_VALIDATED"],
+            data={"results": results},
+            status_code=HTTPStatus.OK,
+        )
+
     async def change_password(
         self, id: str, user_data: ChangeUserPasswordRequest
     ) -> tuple:
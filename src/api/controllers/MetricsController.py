@@ -0,0 +1,26 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from src.utils.svcs import Service
+from src.utils.logger import Logger
+from src.api.constants.messages import DYNAMIC_MESSAGES
+from src.api.utils.response_format import success_response
+from src.api.services.MetricsService import MetricsService
+
+
+@Service()
+class MetricsController:
+    def __init__(
+        self,
+        logger: Annotated[Logger, "MetricsController"],
+        metrics_service: MetricsService,
+    ) -> None:
+        self.logger = logger
+        self.metrics_service = metrics_service
+
+    async def get_metrics(self) -> tuple:
+        return success_response(
+            message=DYNAMIC_MESSAGES["COMMON"]["FETCHED_SUCCESS"]("Metrics"),
+            data=self.metrics_service.collect(),
+            status_code=HTTPStatus.OK,
+        )
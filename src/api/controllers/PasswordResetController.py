@@ -5,6 +5,7 @@ from ninja.errors import HttpError
 
 from src.utils.svcs import Service
 from src.utils.logger import Logger
+from src.utils.executor import ExecutorRejectedError
 from src.api.utils.response_format import success_response
 from src.api.services.PasswordResetService import PasswordResetService
 from src.api.models.payload.requests.PasswordResetRequest import (
@@ -32,7 +33,7 @@ class PasswordResetController:
                 message=sent_request["message"], status_code=HTTPStatus.OK
             )
         except Exception as exc:
-            if isinstance(exc, HttpError):
+            if isinstance(exc, HttpError | ExecutorRejectedError):
                 raise
             self.logger.error(
                 {
@@ -54,7 +55,7 @@ class PasswordResetController:
                 message=sent_request["message"], status_code=HTTPStatus.OK
             )
         except Exception as exc:
-            if isinstance(exc, HttpError):
+            if isinstance(exc, HttpError | ExecutorRejectedError):
                 raise
             self.logger.error(
                 {
@@ -0,0 +1,30 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from src.utils.svcs import Service
+from src.utils.logger import Logger
+from src.api.constants.messages import MESSAGES, DYNAMIC_MESSAGES
+from src.api.services.UserService import UserService
+from src.api.utils.response_format import error_response, success_response
+from src.api.models.payload.requests.ListUsersRequest import ListUsersRequest
+
+
+@Service()
+class UserController:
+    def __init__(
+        self, logger: Annotated[Logger, "UserController"], user_service: UserService
+    ) -> None:
+        self.logger = logger
+        self.user_service = user_service
+
+    async def list_users(self, filters: ListUsersRequest) -> tuple:
+        page = await self.user_service.list_users(filters)
+        if page is None:
+            return error_response(
+                MESSAGES["USER"]["INVALID_CURSOR"], status_code=HTTPStatus.BAD_REQUEST
+            )
+        return success_response(
+            message=DYNAMIC_MESSAGES["COMMON"]["FETCHED_SUCCESS"]("Users"),
+            data=page,
+            status_code=HTTPStatus.OK,
+        )
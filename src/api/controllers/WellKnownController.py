@@ -0,0 +1,35 @@
+import json
+import hashlib
+from http import HTTPStatus
+from typing import Annotated
+
+from django.http import HttpRequest, HttpResponse
+
+from src.env import jwt_config
+from src.utils.svcs import Service
+from src.utils.logger import Logger
+from src.api.services.UtilityService import UtilityService
+
+
+@Service()
+class WellKnownController:
+    def __init__(
+        self,
+        logger: Annotated[Logger, "WellKnownController"],
+        utility_service: UtilityService,
+    ) -> None:
+        self.logger = logger
+        self.utility_service = utility_service
+
+    async def get_jwks(self, request: HttpRequest) -> HttpResponse:
+        body = json.dumps(self.utility_service.get_jwks(), separators=(",", ":"))
+        etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+        if request.headers.get("If-None-Match") == etag:
+            response = HttpResponse(status=HTTPStatus.NOT_MODIFIED)
+        else:
+            response = HttpResponse(body, content_type="application/jwk-set+json")
+
+        response["ETag"] = etag
+        response["Cache-Control"] = f"public, max-age={jwt_config['jwks_max_age']}"
+        return response
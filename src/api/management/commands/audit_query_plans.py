@@ -0,0 +1,416 @@
+import json
+import inspect
+from uuid import uuid4
+from typing import Any, TypedDict
+from argparse import ArgumentParser
+from datetime import timedelta
+from collections.abc import Callable, Awaitable
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+from django.test.utils import (
+    setup_databases,
+    override_settings,
+    teardown_databases,
+)
+from django.core.management.base import BaseCommand, CommandError
+
+from src.api.models.postgres import Otp, User, UserStatus, UserCredentials
+from src.api.repositories.OtpRepository import OtpRepository
+from src.api.repositories.UserRepository import UserRepository
+from src.api.repositories.PasswordResetRepository import PasswordResetRepository
+
+AUDITED_REPOSITORIES = (UserRepository, OtpRepository, PasswordResetRepository)
+AUDITED_STATEMENTS = ("SELECT", "UPDATE", "DELETE", "WITH")
+EXPLAIN = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class AuditCase(TypedDict):
+    method: str
+    call: Callable[[], Awaitable[Any]]
+    hot: bool
+
+
+class PlanResult(TypedDict):
+    method: str
+    hot: bool
+    statement: str
+    scans: list[str]
+    seq_scans: list[str]
+    execution_ms: float
+    shared_hit: int
+    shared_read: int
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the test database, run every repository method against seeded "
+        "rows inside a rolled-back transaction, EXPLAIN (ANALYZE, BUFFERS) each "
+        "query, and fail when a hot path is planned as a sequential scan"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--users", type=int, default=10000, help="users to seed (one OTP each)"
+        )
+        parser.add_argument(
+            "--database",
+            default="pg",
+            help="database alias whose test database is audited",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="keep the test database between runs",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        users: int = options["users"]
+        database: str = options["database"]
+        keepdb: bool = options["keepdb"]
+        verbosity: int = options["verbosity"]
+        if users < 10:
+            raise CommandError("--users must be at least 10")
+
+        # Seeding, EXPLAIN ANALYZE and partition maintenance write and take
+        # locks, so they run on a migrated copy of the schema, never live data
+        # "default" is a dummy every other alias depends on; it creates nothing
+        old_config = setup_databases(
+            verbosity,
+            interactive=False,
+            keepdb=keepdb,
+            # Alias -> whether to serialize, as the test runner passes them;
+            # the audit rolls back, so no copy of the contents is needed
+            aliases=dict.fromkeys((DEFAULT_DB_ALIAS, database), False),
+            serialized_aliases=(),
+        )
+        try:
+            # Cached reads would hide queries, and nothing seeded may outlive
+            # the run
+            with (
+                override_settings(CACHES=NO_CACHE),
+                transaction.atomic(using=database),
+            ):
+                try:
+                    results, audited = self.audit(database, users)
+                finally:
+                    transaction.set_rollback(True, using=database)
+        finally:
+            teardown_databases(old_config, verbosity, keepdb=keepdb)
+
+        self.stdout.write(
+            f"{'method':<52} {'hot':>3} {'ms':>8} {'hit':>6} {'read':>6}  scans"
+        )
+        for result in results:
+            line = (
+                f"{result['method']:<52} {'yes' if result['hot'] else 'no':>3} "
+                f"{result['execution_ms']:>8.3f} {result['shared_hit']:>6} "
+                f"{result['shared_read']:>6}  {', '.join(result['scans']) or '-'}"
+            )
+            style = self.style.ERROR if result["seq_scans"] else self.style.SUCCESS
+            self.stdout.write(style(line) if result["hot"] else line)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"    {result['statement']}")
+
+        uncovered = self.uncovered_methods(audited)
+        if uncovered:
+            self.stdout.write(
+                self.style.WARNING(f"Not audited: {', '.join(uncovered)}")
+            )
+
+        offenders = sorted(
+            {
+                result["method"]
+                for result in results
+                if result["hot"] and result["seq_scans"]
+            }
+        )
+        if offenders:
+            raise CommandError(f"Sequential scans on hot paths: {', '.join(offenders)}")
+        self.stdout.write(self.style.SUCCESS("No sequential scans on hot paths"))
+
+    def audit(self, database: str, users: int) -> tuple[list[PlanResult], set[str]]:
+        connection = connections[database]
+        user, otp = self.seed(database, users)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE users, otps")
+
+        cases = self.cases(user, otp)
+        results: list[PlanResult] = []
+        for case in cases:
+            statements: list[tuple[str, Any]] = []
+
+            def capture(execute: Callable, sql: str, params: Any, *args: Any) -> Any:  # noqa: ANN401
+                statements.append((sql, params))
+                return execute(sql, params, *args)
+
+            async def run(call: Callable[[], Awaitable[Any]] = case["call"]) -> None:
+                await call()
+
+            with connection.execute_wrapper(capture):
+                async_to_sync(run)()
+
+            for sql, params in statements:
+                if sql.lstrip().upper().startswith(AUDITED_STATEMENTS):
+                    results.append(self.explain(database, case, sql, params))
+        return results, {case["method"].split(" ")[0] for case in cases}
+
+    def seed(self, database: str, users: int) -> tuple[User, Otp]:
+        now = timezone.now()
+        seeded_users = User.objects.using(database).bulk_create(
+            [
+                User(
+                    email=f"audit-{index}-{uuid4().hex[:8]}@example.com",
+                    password="audit",  # noqa: S106
+                    password_reset_token=str(uuid4()) if index % 10 == 0 else "",
+                    is_validated=index % 3 != 0,
+                    is_active=index % 3 != 0,
+                    is_enabled=index % 4 != 0,
+                )
+                for index in range(users)
+            ],
+            batch_size=1000,
+        )
+        seeded_otps = Otp.objects.using(database).bulk_create(
+            [
+                Otp(user=user, key=f"{index % 1000000:06d}")
+                for index, user in enumerate(seeded_users)
+            ],
+            batch_size=1000,
+        )
+        # Spread OTP ages so lifetime filters select a realistic slice
+        Otp.objects.using(database).filter(
+            pk__in=[otp.pk for otp in seeded_otps[::2]]
+        ).update(created_at=now - timedelta(days=1))
+
+        user = seeded_users[0]
+        user.refresh_from_db(using=database)
+        return user, seeded_otps[0]
+
+    def cases(self, user: User, otp: Otp) -> list[AuditCase]:
+        lifetime = timedelta(minutes=10)
+        cursor = (user.created_at, user.id)
+        return [
+            {
+                "method": "UserRepository.find_by_id",
+                "call": lambda: UserRepository.find_by_id(user.id),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.find_by_email",
+                "call": lambda: UserRepository.find_by_email(user.email),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.find_public_by_id",
+                "call": lambda: UserRepository.find_public_by_id(user.id),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.find_public_by_email",
+                "call": lambda: UserRepository.find_public_by_email(user.email),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.find_credentials_by_id",
+                "call": lambda: UserRepository.find_credentials_by_id(user.id),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.find_credentials_by_email",
+                "call": lambda: UserRepository.find_credentials_by_email(user.email),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.find_by_reset_token",
+                "call": lambda: UserRepository.find_by_reset_token(
+                    user.password_reset_token
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.list",
+                "call": lambda: UserRepository.list({"is_active": True}, limit=21),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.list (after cursor)",
+                "call": lambda: UserRepository.list(
+                    {"is_active": True}, after=cursor, limit=21
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.list (login allowed)",
+                "call": lambda: UserRepository.list(
+                    {
+                        "is_validated": True,
+                        "is_active": True,
+                        "is_enabled": True,
+                        "is_deleted": False,
+                    },
+                    limit=21,
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.update_by_user",
+                "call": lambda: UserRepository.update_by_user(
+                    user, {"is_enabled": not user.is_enabled}
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.update_by_id",
+                "call": lambda: UserRepository.update_by_id(
+                    user.id, {"is_enabled": not user.is_enabled}
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.update_if",
+                "call": lambda: UserRepository.update_if(
+                    user, {"password": user.password}, {"password": user.password}
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.update_password_if",
+                "call": lambda: UserRepository.update_password_if(
+                    UserCredentials.of(user), user.password
+                ),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.add_status",
+                "call": lambda: UserRepository.add_status(user, UserStatus.VALIDATED),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.bulk_update",
+                "call": lambda: UserRepository.bulk_update([user], ["status"]),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.count",
+                "call": lambda: UserRepository.count({"is_validated": True}),
+                "hot": False,
+            },
+            {
+                "method": "PasswordResetRepository.set_new_password_reset_token",
+                "call": lambda: PasswordResetRepository.set_new_password_reset_token(
+                    user, uuid4(), timezone.now()
+                ),
+                "hot": True,
+            },
+            {
+                "method": "OtpRepository.find_by_key",
+                "call": lambda: OtpRepository.find_by_key(otp.key),
+                "hot": True,
+            },
+            {
+                "method": "OtpRepository.find_valid_key",
+                "call": lambda: OtpRepository.find_valid_key(otp.key, lifetime),
+                "hot": True,
+            },
+            {
+                "method": "OtpRepository.find_valid_user_key",
+                "call": lambda: OtpRepository.find_valid_user_key(user, lifetime),
+                "hot": True,
+            },
+            {
+                "method": "UserRepository.update_by_otp",
+                "call": lambda: UserRepository.update_by_otp(
+                    user.email, otp.key, timezone.now() - lifetime, UserStatus.ACTIVE
+                ),
+                "hot": True,
+            },
+            {
+                "method": "OtpRepository.consume_user_key",
+                "call": lambda: OtpRepository.consume_user_key(user, otp.key, lifetime),
+                "hot": True,
+            },
+            {
+                "method": "OtpRepository.delete_created_before",
+                "call": lambda: OtpRepository.delete_created_before(
+                    timezone.now() - timedelta(hours=1), 1000
+                ),
+                "hot": False,
+            },
+            {
+                "method": "OtpRepository.maintain_partitions",
+                "call": lambda: OtpRepository.maintain_partitions(
+                    timezone.now() - timedelta(days=1), 1
+                ),
+                "hot": False,
+            },
+        ]
+
+    def explain(
+        self,
+        database: str,
+        case: AuditCase,
+        sql: str,
+        params: Any,  # noqa: ANN401
+    ) -> PlanResult:
+        # EXPLAIN ANALYZE executes the statement; the savepoint undoes writes
+        with (
+            transaction.atomic(using=database),
+            connections[database].cursor() as cursor,
+        ):
+            cursor.execute(EXPLAIN + sql, params)
+            explained = cursor.fetchone()[0]
+            transaction.set_rollback(True, using=database)
+
+        plan = (json.loads(explained) if isinstance(explained, str) else explained)[0]
+        scans: list[str] = []
+        seq_scans: list[str] = []
+        nodes = [plan["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.get("Plans", []))
+            if "Relation Name" not in node:
+                continue
+
+            scan = f"{node['Node Type']} on {node['Relation Name']}"
+            if "Index Name" in node:
+                scan = f"{scan} ({node['Index Name']})"
+            scans.append(scan)
+            # Empty partitions are always seq scanned; that reads no pages
+            touched = node.get("Shared Hit Blocks", 0) + node.get(
+                "Shared Read Blocks", 0
+            )
+            if node["Node Type"] == "Seq Scan" and touched:
+                seq_scans.append(scan)
+
+        return {
+            "method": case["method"],
+            "hot": case["hot"],
+            "statement": sql,
+            "scans": scans,
+            "seq_scans": seq_scans,
+            "execution_ms": plan.get("Execution Time", 0.0),
+            "shared_hit": plan["Plan"].get("Shared Hit Blocks", 0),
+            "shared_read": plan["Plan"].get("Shared Read Blocks", 0),
+        }
+
+    def uncovered_methods(self, audited: set[str]) -> list[str]:
+        # Only methods a repository declares itself; inherited ones are shared
+        uncovered = []
+        for repository in AUDITED_REPOSITORIES:
+            for name in vars(repository):
+                member = getattr(repository, name)
+                is_query = inspect.iscoroutinefunction(
+                    member
+                ) or inspect.isasyncgenfunction(member)
+                method = f"{repository.__name__}.{name}"
+                if (
+                    is_query
+                    and not name.startswith(("_", "on_"))
+                    and method not in audited
+                ):
+                    uncovered.append(method)
+        return uncovered
@@ -0,0 +1,177 @@
+import os
+import time
+import asyncio
+import statistics
+from typing import Any, TypedDict
+from argparse import ArgumentParser
+from functools import partial
+from collections.abc import Callable, Awaitable
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.env import hashing
+from src.utils.hashers import BCryptHasher
+from src.utils.executor import ExecutorRejectedError
+from src.api.services.UtilityService import UtilityService, hash_executor
+
+BENCHMARK_PASSWORD = "Benchmark-Passw0rd!"  # noqa: S105
+
+
+class BenchmarkResult(TypedDict):
+    cost: int
+    operation: str
+    concurrency: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    per_second: float
+    per_second_per_core: float
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark password hashing and verification at several bcrypt costs and "
+        "concurrency levels, and recommend a cost that fits the login latency budget"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--costs", type=int, nargs="+", default=[8, 10, 12], help="bcrypt costs"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=sorted({1, hashing["workers"]}),
+            help="concurrent callers on the hashing pool per run",
+        )
+        parser.add_argument(
+            "--samples", type=int, default=32, help="operations per run"
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=hashing["login_budget_ms"],
+            help="p95 verification latency allowed per login",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        costs: list[int] = options["costs"]
+        levels: list[int] = options["concurrency"]
+        samples: int = options["samples"]
+        budget_ms: float = options["budget_ms"]
+
+        if samples < 2:
+            raise CommandError("--samples must be at least 2")
+        if any(cost < 4 or cost > 31 for cost in costs):
+            raise CommandError("bcrypt costs must be between 4 and 31")
+        capacity = hash_executor.workers + hash_executor.queue_size
+        if any(level < 1 or level > capacity for level in levels):
+            raise CommandError(
+                f"--concurrency must be between 1 and {capacity}, the hashing "
+                "pool's workers plus queue"
+            )
+
+        cores = os.cpu_count() or 1
+        self.stdout.write(
+            f"Host: {cores} cores, {hash_executor.workers}-worker "
+            f"{hash_executor.kind} pool, budget {budget_ms}ms p95"
+        )
+        self.stdout.write(
+            f"{'cost':>4} {'op':>6} {'conc':>4} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'p99 ms':>9} {'ops/s':>9} {'ops/s/core':>10}"
+        )
+
+        results = asyncio.run(self.run_benchmarks(costs, levels, samples, cores))
+        for result in results:
+            self.stdout.write(
+                f"{result['cost']:>4} {result['operation']:>6} "
+                f"{result['concurrency']:>4} {result['p50_ms']:>9.1f} "
+                f"{result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f} "
+                f"{result['per_second']:>9.1f} {result['per_second_per_core']:>10.1f}"
+            )
+
+        within_budget = [
+            cost
+            for cost in costs
+            if all(
+                result["p95_ms"] <= budget_ms
+                for result in results
+                if result["cost"] == cost and result["operation"] == "verify"
+            )
+        ]
+        if not within_budget:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"No tested cost keeps verification p95 within {budget_ms}ms"
+                )
+            )
+            return
+
+        recommended = max(within_budget)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recommended BCRYPT_ROUNDS={recommended} "
+                f"(currently {hashing['bcrypt_rounds']})"
+            )
+        )
+
+    async def run_benchmarks(
+        self, costs: list[int], levels: list[int], samples: int, cores: int
+    ) -> list[BenchmarkResult]:
+        results: list[BenchmarkResult] = []
+        for cost in costs:
+            hasher = BCryptHasher(rounds=cost)
+            encoded = await UtilityService.hash_string(BENCHMARK_PASSWORD, hasher)
+            operations: dict[str, Callable[[], Awaitable[object]]] = {
+                "hash": partial(UtilityService.hash_string, BENCHMARK_PASSWORD, hasher),
+                "verify": partial(
+                    UtilityService.compare_hash, BENCHMARK_PASSWORD, encoded
+                ),
+            }
+            for operation, call in operations.items():
+                for concurrency in levels:
+                    latencies, elapsed = await self.measure(call, concurrency, samples)
+                    quantiles = statistics.quantiles(latencies, n=100)
+                    per_second = samples / elapsed
+                    # Callers beyond the pool's workers queue rather than run
+                    busy = min(concurrency, hash_executor.workers, cores)
+                    results.append(
+                        {
+                            "cost": cost,
+                            "operation": operation,
+                            "concurrency": concurrency,
+                            "p50_ms": quantiles[49] * 1000,
+                            "p95_ms": quantiles[94] * 1000,
+                            "p99_ms": quantiles[98] * 1000,
+                            "per_second": per_second,
+                            "per_second_per_core": per_second / busy,
+                        }
+                    )
+        return results
+
+    async def measure(
+        self,
+        call: Callable[[], Awaitable[object]],
+        concurrency: int,
+        samples: int,
+    ) -> tuple[list[float], float]:
+        latencies: list[float] = []
+        remaining = samples
+
+        async def caller() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started_at = time.perf_counter()
+                await call()
+                latencies.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        try:
+            await asyncio.gather(*(caller() for _ in range(concurrency)))
+        except ExecutorRejectedError as exc:
+            raise CommandError(f"The hashing pool rejected a call: {exc}") from exc
+        elapsed = time.perf_counter() - started_at
+
+        return latencies, elapsed
@@ -0,0 +1,44 @@
+from typing import Any
+from pathlib import Path
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand, CommandError
+from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
+
+from src.utils.jwks import ASYMMETRIC_ALGORITHMS
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a PEM private key for JWT signing. To rotate keys, put the new "
+        "file first in JWT_SIGNING_KEYS and keep the previous one after it until "
+        "its tokens have expired"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--algorithm", choices=ASYMMETRIC_ALGORITHMS, default="EdDSA"
+        )
+        parser.add_argument("--output", required=True, help="path of the PEM file")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        output = Path(options["output"])
+        if output.exists():
+            raise CommandError(f"{output} already exists")
+
+        if options["algorithm"] == "RS256":
+            key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        else:
+            key = ed25519.Ed25519PrivateKey.generate()
+
+        pem = key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+        output.write_bytes(pem)
+        output.chmod(0o600)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {options['algorithm']} key to {output}")
+        )
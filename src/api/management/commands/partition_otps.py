@@ -0,0 +1,49 @@
+from typing import Any
+from argparse import ArgumentParser
+
+from django.utils import timezone
+from django.core.management.base import BaseCommand
+
+from src.env import otp
+from src.api.repositories.OtpRepository import OtpRepository
+from src.api.services.OtpRetentionService import OTP_RETENTION
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert the otps table to daily range partitions on created_at, keeping "
+        "only rows inside the retention window, then create upcoming partitions "
+        "and drop expired ones"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--days-ahead",
+            type=int,
+            default=otp["partition_days_ahead"],
+            help="daily partitions to create ahead of today",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        days_ahead: int = options["days_ahead"]
+        cutoff = timezone.now() - OTP_RETENTION
+        partitions = OtpRepository.partitions()
+
+        if partitions.is_partitioned():
+            self.stdout.write(f"{partitions.table} is already partitioned")
+        else:
+            # Takes an exclusive lock on the table for the length of the copy
+            copied = partitions.convert(cutoff, days_ahead)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Partitioned {partitions.table}, kept {copied} rows newer "
+                    f"than {cutoff.isoformat()}"
+                )
+            )
+
+        dropped = partitions.maintain(cutoff, days_ahead)
+        if dropped:
+            self.stdout.write(f"Dropped {', '.join(dropped)}")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(partitions.partitions())} partitions")
+        )
@@ -1,12 +1,13 @@
 from http import HTTPStatus
 
-import jwt
 from django.http import HttpRequest
 from ninja.errors import HttpError
 from ninja.security import HttpBearer
 
-from src.env import jwt_config
+from src.env import admin
 from src.utils.logger import Logger
+from src.api.services.UtilityService import UtilityService
+from src.api.middlewares.GateWayMiddleware import GateWayAuth
 
 
 class Authentication(HttpBearer):
@@ -14,17 +15,9 @@ class Authentication(HttpBearer):
         super().__init__()
         self.logger = logger
 
-    def authenticate(self, request: HttpRequest, token: str) -> str:
-        jwt_data = jwt.decode(
-            token,
-            jwt_config["secret"],
-            algorithms=["HS256"],
-            options={"verify_signature": False},
-        )
-
-        email = jwt_data.get("email")
-        user_id = jwt_data.get("user_id")
-        if not email or not user_id:
+    async def authenticate(self, request: HttpRequest, token: str) -> str:
+        jwt_data = await UtilityService.adecrypt_jwt(token)
+        if not jwt_data:
             message = "Invalid authentication token"
             self.logger.error(
                 {
@@ -50,8 +43,39 @@ class Authentication(HttpBearer):
         return token
 
 
+class AdminAuthentication(Authentication):
+    """A gateway request carrying the token of a user listed in ADMIN_USER_IDS."""
+
+    def __init__(self, logger: Logger) -> None:
+        super().__init__(logger)
+        # Routes with their own auth skip the global gateway check
+        self.gateway_auth = GateWayAuth(logger)
+
+    async def authenticate(self, request: HttpRequest, token: str) -> str:
+        self.gateway_auth.authenticate(request, None)
+        token = await super().authenticate(request, token)
+
+        user_id = getattr(request, "auth_id")
+        if user_id not in admin["user_ids"]:
+            message = "Admin access required"
+            self.logger.warn(
+                {
+                    "activity_type": "Authenticate Admin",
+                    "message": message,
+                    "metadata": {"user_id": user_id},
+                }
+            )
+            raise HttpError(HTTPStatus.FORBIDDEN, message)
+        return token
+
+
 def get_authentication() -> Authentication:
     return Authentication(Logger("Authentication"))
 
 
+def get_admin_authentication() -> AdminAuthentication:
+    return AdminAuthentication(Logger("Authentication"))
+
+
 authentication = get_authentication()
+admin_authentication = get_admin_authentication()
@@ -8,7 +8,7 @@ from faststream.rabbit.message import RabbitMessage
 
 from src.env import queue
 from src.utils.logger import Logger
-from src.api.services.UtilityService import UtilityService
+from src.api.services.UtilityService import UtilityService, queue_signature_verifier
 from src.api.constants.signature_sources import SIGNATURE_SOURCES
 
 
@@ -25,7 +25,7 @@ class PublishMiddleware(BaseMiddleware):
         **kwargs: dict[str, Any],
     ) -> CoroutineType:
         timestamp = UtilityService.get_timestamp()
-        signature = UtilityService.generate_signature(queue["key"], timestamp)
+        signature = queue_signature_verifier.sign(timestamp)
 
         headers = {}
 
@@ -48,9 +48,10 @@ class SubscribeMiddleware(BaseMiddleware):
                 signature_data={
                     "signature": msg.headers["X-BROKER-SIGNATURE"],
                     "timestamp": msg.headers["X-BROKER-TIMESTAMP"],
-                    "key": queue["key"],
-                    "ttl": queue["ttl"],
-                    "title": SIGNATURE_SOURCES["gateway"],
+                    "verifier": queue_signature_verifier,
+                    # Redelivered messages legitimately carry the same signature
+                    "allow_replay": msg.raw_message.redelivered,
+                    "title": SIGNATURE_SOURCES["queue"],
                 },
             )
 
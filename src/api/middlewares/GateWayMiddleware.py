@@ -3,9 +3,12 @@ from ninja.errors import AuthenticationError
 from ninja.security import APIKeyHeader
 from ninja.openapi.schema import OpenAPISchema
 
-from src.env import api_gateway
 from src.utils.logger import Logger
-from src.api.services.UtilityService import SignatureData, UtilityService
+from src.api.services.UtilityService import (
+    SignatureData,
+    UtilityService,
+    gateway_signature_verifier,
+)
 from src.api.constants.signature_sources import SIGNATURE_SOURCES
 
 
@@ -32,8 +35,7 @@ class GateWayAuth(APIKeyHeader):
         signature_data: SignatureData = {
             "signature": api_signature,
             "timestamp": api_timestamp,
-            "key": api_gateway["key"],
-            "ttl": api_gateway["ttl"],
+            "verifier": gateway_signature_verifier,
             "title": SIGNATURE_SOURCES["gateway"],
         }
 
@@ -60,11 +62,22 @@ def get_authentication() -> GateWayAuth:
 
 
 def add_global_headers(schema: OpenAPISchema) -> OpenAPISchema:
+    schemes = schema["components"]["securitySchemes"]
     for path in schema["paths"]:
         for method in schema["paths"][path]:
             operation = schema["paths"][path][method]
             if operation.get("security"):
-                operation["security"] = schema["security"]
+                # Routes with their own auth, e.g. a bearer token, need both
+                route_security = {
+                    name: scopes
+                    for requirement in operation["security"]
+                    for name, scopes in requirement.items()
+                    if name in schemes
+                }
+                operation["security"] = [
+                    dict(route_security, **requirement)
+                    for requirement in schema["security"]
+                ]
     return schema
 
 
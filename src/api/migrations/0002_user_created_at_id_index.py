@@ -0,0 +1,20 @@
+# Generated by Django 5.1.8 on 2026-10-18 03:07
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(fields=['created_at', 'id'], name='users_created_1b562c_idx'),
+        ),
+    ]
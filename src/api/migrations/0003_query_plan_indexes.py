@@ -0,0 +1,24 @@
+# Generated by Django 5.1.8 on 2026-10-18 03:09
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0002_user_created_at_id_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='otp',
+            index=models.Index(fields=['user', 'created_at'], name='otps_user_id_a9d722_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(fields=['password_reset_token'], name='users_passwor_dda668_idx'),
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 5.1.8 on 2026-10-18 03:20
+
+from django.db import migrations
+
+import src.api.models.postgres._fields
+
+BACKFILL_BATCH_SIZE = 5000
+
+# normalize_email in SQL, for rows written by code that predates the column
+NORMALIZE = "lower(btrim({email}, E' \\t\\n\\r\\f\\x0b'))"
+
+# Fills the column for rows old code writes while the backfill runs. A case
+# duplicate of an account that already holds the address stays NULL, which
+# the unique index allows; code that sets the column itself is refused by the
+# index instead
+SYNC_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION users_sync_email_normalized() RETURNS trigger AS $$
+BEGIN
+    IF NEW.email_normalized IS NULL
+        OR (TG_OP = 'UPDATE' AND NEW.email IS DISTINCT FROM OLD.email
+            AND NEW.email_normalized IS NOT DISTINCT FROM OLD.email_normalized) THEN
+        NEW.email_normalized := {NORMALIZE.format(email="NEW.email")};
+        IF EXISTS (
+            SELECT 1 FROM users
+            WHERE email_normalized = NEW.email_normalized AND id <> NEW.id
+        ) THEN
+            NEW.email_normalized := NULL;
+        END IF;
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS users_sync_email_normalized ON users;
+CREATE TRIGGER users_sync_email_normalized
+    BEFORE INSERT OR UPDATE OF email, email_normalized ON users
+    FOR EACH ROW EXECUTE FUNCTION users_sync_email_normalized();
+"""
+
+DROP_SYNC_TRIGGER = """
+DROP TRIGGER IF EXISTS users_sync_email_normalized ON users;
+DROP FUNCTION IF EXISTS users_sync_email_normalized();
+"""
+
+# Every account but the oldest of each group of emails equal up to case
+CASE_DUPLICATES = f"""
+SELECT id FROM (
+    SELECT id, row_number() OVER (
+        PARTITION BY {NORMALIZE.format(email="email")} ORDER BY created_at, id
+    ) AS rank
+    FROM users
+) ranked
+WHERE rank > 1
+"""
+
+
+def backfill_email_normalized(apps, schema_editor):
+    """
+    Fill email_normalized in primary key batches, one commit each. When two
+    emails differ only by case, the older account keeps the address and the
+    newer ones are left NULL; find_by_email matches those by their exact
+    email first, so each account still logs in with its own address.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(CASE_DUPLICATES)
+        duplicates = [id for (id,) in cursor.fetchall()]
+
+        after = None
+        while True:
+            # Rows whose address is already taken stay NULL, so the keyset
+            # follows the batch rather than the updated rows
+            cursor.execute(
+                "WITH batch AS (SELECT id FROM users "
+                "WHERE email_normalized IS NULL AND id <> ALL(%s::varchar[])"
+                f"{' AND id > %s' if after else ''} ORDER BY id LIMIT %s), "
+                f"updated AS (UPDATE users SET email_normalized = {NORMALIZE.format(email='users.email')} "
+                "FROM batch WHERE users.id = batch.id AND NOT EXISTS ("
+                "SELECT 1 FROM users taken WHERE taken.email_normalized = "
+                f"{NORMALIZE.format(email='users.email')})) "
+                "SELECT count(*), max(id) FROM batch",
+                [duplicates, after, BACKFILL_BATCH_SIZE] if after else [duplicates, BACKFILL_BATCH_SIZE],
+            )
+            count, after = cursor.fetchone()
+            if count < BACKFILL_BATCH_SIZE:
+                return
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0003_query_plan_indexes'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='user',
+                    name='email_normalized',
+                    field=src.api.models.postgres._fields.NormalizedEmailField(max_length=255, null=True, source='email', unique=True),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'ALTER TABLE "users" ADD COLUMN "email_normalized" varchar(255) NULL',
+                    reverse_sql='ALTER TABLE "users" DROP COLUMN "email_normalized"',
+                ),
+                # Built before the backfill so new signups are already checked
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY "users_email_normalized_key" ON "users" ("email_normalized")',
+                    reverse_sql='DROP INDEX CONCURRENTLY "users_email_normalized_key"',
+                ),
+                migrations.RunSQL(SYNC_TRIGGER, DROP_SYNC_TRIGGER),
+            ],
+        ),
+        migrations.RunPython(backfill_email_normalized, migrations.RunPython.noop),
+        # New code sets the column itself. Rows old code writes from here on
+        # stay NULL and are matched by their exact email, like case duplicates
+        migrations.RunSQL(DROP_SYNC_TRIGGER, SYNC_TRIGGER),
+    ]
@@ -0,0 +1,185 @@
+# Generated by Django 5.1.8 on 2026-10-18 03:30
+
+import uuid
+
+from django.db import migrations, models, transaction
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Keep the shadow columns current for rows written while the migration runs
+SYNC_TRIGGERS = """
+CREATE OR REPLACE FUNCTION users_sync_id_uuid() RETURNS trigger AS $$
+BEGIN
+    NEW.id_uuid := NEW.id::uuid;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS users_sync_id_uuid ON users;
+CREATE TRIGGER users_sync_id_uuid BEFORE INSERT OR UPDATE OF id ON users
+    FOR EACH ROW EXECUTE FUNCTION users_sync_id_uuid();
+
+CREATE OR REPLACE FUNCTION otps_sync_user_uuid() RETURNS trigger AS $$
+BEGIN
+    NEW.user_uuid := NEW.user_id::uuid;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS otps_sync_user_uuid ON otps;
+CREATE TRIGGER otps_sync_user_uuid BEFORE INSERT OR UPDATE OF user_id ON otps
+    FOR EACH ROW EXECUTE FUNCTION otps_sync_user_uuid();
+"""
+
+DROP_SYNC_TRIGGERS = """
+DROP TRIGGER IF EXISTS users_sync_id_uuid ON users;
+DROP FUNCTION IF EXISTS users_sync_id_uuid();
+DROP TRIGGER IF EXISTS otps_sync_user_uuid ON otps;
+DROP FUNCTION IF EXISTS otps_sync_user_uuid();
+"""
+
+# (name on the shadow column, name once swapped in, definition)
+USER_INDEXES = (
+    ("users_id_uuid_key", "users_pkey", "CREATE UNIQUE INDEX {concurrently} {name} ON users (id_uuid)"),
+    ("users_created_id_uuid_idx", "users_created_1b562c_idx", "CREATE INDEX {concurrently} {name} ON users (created_at, id_uuid)"),
+)
+OTP_INDEXES = (
+    ("otps_user_uuid_idx", "otps_user_id_89aef334", "CREATE INDEX {concurrently} {name} ON otps (user_uuid)"),
+    ("otps_user_uuid_created_idx", "otps_user_id_a9d722_idx", "CREATE INDEX {concurrently} {name} ON otps (user_uuid, created_at)"),
+)
+
+
+def is_partitioned(cursor, table):
+    cursor.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(%s)", [table])
+    return cursor.fetchone()[0]
+
+
+def add_shadow_columns(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS id_uuid uuid")
+        cursor.execute("ALTER TABLE otps ADD COLUMN IF NOT EXISTS user_uuid uuid")
+        cursor.execute(SYNC_TRIGGERS)
+
+
+def backfill(cursor, table, key, source, target):
+    """Copy `source`::uuid into `target` in keyset batches, one commit each."""
+    after = None
+    while True:
+        cursor.execute(
+            f"WITH batch AS (SELECT {key} FROM {table} "
+            f"WHERE {source} IS NOT NULL AND {target} IS NULL"
+            f"{f' AND {key} > %s' if after is not None else ''} "
+            f"ORDER BY {key} LIMIT %s) "
+            f"UPDATE {table} SET {target} = {table}.{source}::uuid FROM batch "
+            f"WHERE {table}.{key} = batch.{key} RETURNING {table}.{key}",
+            [after, BACKFILL_BATCH_SIZE] if after is not None else [BACKFILL_BATCH_SIZE],
+        )
+        keys = [row[0] for row in cursor.fetchall()]
+        if len(keys) < BACKFILL_BATCH_SIZE:
+            return
+        after = max(keys)
+
+
+def backfill_shadow_columns(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        backfill(cursor, "users", "id", "id", "id_uuid")
+        backfill(cursor, "otps", "id", "user_id", "user_uuid")
+
+
+def build_indexes(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for name, _, definition in USER_INDEXES:
+            cursor.execute(definition.format(concurrently="CONCURRENTLY IF NOT EXISTS", name=name))
+        # CONCURRENTLY is not available on partitioned tables; their
+        # partitions only hold the retention window
+        concurrently = "IF NOT EXISTS" if is_partitioned(cursor, "otps") else "CONCURRENTLY IF NOT EXISTS"
+        for name, _, definition in OTP_INDEXES:
+            cursor.execute(definition.format(concurrently=concurrently, name=name))
+
+        # Rows the batches raced past are caught here, before any lock is held
+        backfill(cursor, "users", "id", "id", "id_uuid")
+        backfill(cursor, "otps", "id", "user_id", "user_uuid")
+
+        # Validated CHECKs prove the swap has nothing left to copy, and let
+        # SET NOT NULL skip its table scan under lock
+        cursor.execute(
+            "ALTER TABLE users DROP CONSTRAINT IF EXISTS users_id_uuid_not_null, "
+            "ADD CONSTRAINT users_id_uuid_not_null CHECK (id_uuid IS NOT NULL) NOT VALID"
+        )
+        cursor.execute("ALTER TABLE users VALIDATE CONSTRAINT users_id_uuid_not_null")
+        cursor.execute(
+            "ALTER TABLE otps DROP CONSTRAINT IF EXISTS otps_user_uuid_synced, "
+            "ADD CONSTRAINT otps_user_uuid_synced "
+            "CHECK (user_id IS NULL OR user_uuid IS NOT NULL) NOT VALID"
+        )
+        cursor.execute("ALTER TABLE otps VALIDATE CONSTRAINT otps_user_uuid_synced")
+
+
+def swap_columns(apps, schema_editor):
+    connection = schema_editor.connection
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute("LOCK TABLE users, otps IN ACCESS EXCLUSIVE MODE")
+        # The triggers kept every row in sync since the validated CHECKs
+        cursor.execute(DROP_SYNC_TRIGGERS)
+        cursor.execute("ALTER TABLE otps DROP CONSTRAINT otps_user_uuid_synced")
+
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = 'otps'::regclass "
+            "AND confrelid = 'users'::regclass AND contype = 'f'"
+        )
+        foreign_keys = [name for (name,) in cursor.fetchall()]
+        for name in foreign_keys:
+            cursor.execute(f"ALTER TABLE otps DROP CONSTRAINT {name}")
+
+        cursor.execute("ALTER TABLE users DROP CONSTRAINT users_pkey")
+        cursor.execute("ALTER TABLE users DROP COLUMN id")
+        cursor.execute("ALTER TABLE users RENAME COLUMN id_uuid TO id")
+        cursor.execute("ALTER TABLE users ALTER COLUMN id SET NOT NULL")
+        cursor.execute("ALTER TABLE users DROP CONSTRAINT users_id_uuid_not_null")
+        for name, final_name, _ in USER_INDEXES:
+            if final_name != "users_pkey":
+                cursor.execute(f"ALTER INDEX {name} RENAME TO {final_name}")
+        cursor.execute("ALTER TABLE users ADD CONSTRAINT users_pkey PRIMARY KEY USING INDEX users_id_uuid_key")
+
+        cursor.execute("ALTER TABLE otps DROP COLUMN user_id")
+        cursor.execute("ALTER TABLE otps RENAME COLUMN user_uuid TO user_id")
+        for name, final_name, _ in OTP_INDEXES:
+            cursor.execute(f"ALTER INDEX {name} RENAME TO {final_name}")
+
+        # Partitioned tables cannot take a NOT VALID foreign key
+        validate = not is_partitioned(cursor, "otps")
+        for name in foreign_keys or ["otps_user_id_89aef334_fk_users_id"]:
+            cursor.execute(
+                f"ALTER TABLE otps ADD CONSTRAINT {name} FOREIGN KEY (user_id) "
+                f"REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED"
+                f"{' NOT VALID' if validate else ''}"
+            )
+
+    if validate:
+        # Checks existing rows without blocking writes
+        with connection.cursor() as cursor:
+            for name in foreign_keys or ["otps_user_id_89aef334_fk_users_id"]:
+                cursor.execute(f"ALTER TABLE otps VALIDATE CONSTRAINT {name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0004_user_email_normalized'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='user',
+                    name='id',
+                    field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_shadow_columns),
+                migrations.RunPython(backfill_shadow_columns),
+                migrations.RunPython(build_indexes),
+                migrations.RunPython(swap_columns),
+            ],
+        ),
+    ]
@@ -0,0 +1,138 @@
+# Generated by Django 5.1.8 on 2026-10-18 03:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 5000
+
+PACK_FLAGS = (
+    "{row}is_validated::int | ({row}is_active::int << 1) "
+    "| ({row}is_enabled::int << 2) | ({row}is_deleted::int << 3)"
+)
+
+# Old code writes the booleans and new code writes status; whichever side a
+# write touched is copied to the other until a later release drops the
+# booleans, see CHANGELOG.md
+SYNC_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION users_sync_status() RETURNS trigger AS $$
+BEGIN
+    IF (TG_OP = 'INSERT' AND NEW.is_validated IS NULL)
+        OR (TG_OP = 'UPDATE' AND NEW.status IS DISTINCT FROM OLD.status) THEN
+        NEW.is_validated := (NEW.status & 1) <> 0;
+        NEW.is_active := (NEW.status & 2) <> 0;
+        NEW.is_enabled := (NEW.status & 4) <> 0;
+        NEW.is_deleted := (NEW.status & 8) <> 0;
+    ELSE
+        NEW.status := {PACK_FLAGS.format(row="NEW.")};
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS users_sync_status ON users;
+CREATE TRIGGER users_sync_status BEFORE INSERT OR UPDATE ON users
+    FOR EACH ROW EXECUTE FUNCTION users_sync_status();
+"""
+
+DROP_SYNC_TRIGGER = """
+DROP TRIGGER IF EXISTS users_sync_status ON users;
+DROP FUNCTION IF EXISTS users_sync_status();
+"""
+
+
+def backfill_status(apps, schema_editor):
+    """Pack the flags in keyset batches, one commit each."""
+    with schema_editor.connection.cursor() as cursor:
+        after = None
+        while True:
+            cursor.execute(
+                "WITH batch AS (SELECT id FROM users"
+                f"{' WHERE id > %s' if after else ''} ORDER BY id LIMIT %s) "
+                f"UPDATE users SET status = {PACK_FLAGS.format(row='users.')} "
+                "FROM batch WHERE users.id = batch.id RETURNING users.id",
+                [after, BACKFILL_BATCH_SIZE] if after else [BACKFILL_BATCH_SIZE],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            if len(ids) < BACKFILL_BATCH_SIZE:
+                return
+            after = max(ids)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0005_user_uuid_primary_key'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='user',
+                    name='status',
+                    field=models.PositiveSmallIntegerField(default=0),
+                ),
+            ],
+            database_operations=[
+                # A constant default and a NOT VALID check avoid a table scan
+                # under the ACCESS EXCLUSIVE lock
+                migrations.RunSQL(
+                    'ALTER TABLE "users" ADD COLUMN "status" smallint NOT NULL DEFAULT 0, '
+                    'ADD CONSTRAINT "users_status_check" CHECK ("status" >= 0) NOT VALID',
+                    reverse_sql='ALTER TABLE "users" DROP COLUMN "status"',
+                ),
+                migrations.RunSQL('ALTER TABLE "users" VALIDATE CONSTRAINT "users_status_check"', migrations.RunSQL.noop),
+                # New code inserts without the booleans; the trigger fills them in
+                migrations.RunSQL(
+                    'ALTER TABLE "users" ALTER COLUMN "is_validated" DROP NOT NULL, '
+                    'ALTER COLUMN "is_active" DROP NOT NULL, '
+                    'ALTER COLUMN "is_enabled" DROP NOT NULL, '
+                    'ALTER COLUMN "is_deleted" DROP NOT NULL',
+                    reverse_sql='ALTER TABLE "users" ALTER COLUMN "is_validated" SET NOT NULL, '
+                    'ALTER COLUMN "is_active" SET NOT NULL, '
+                    'ALTER COLUMN "is_enabled" SET NOT NULL, '
+                    'ALTER COLUMN "is_deleted" SET NOT NULL',
+                ),
+                migrations.RunSQL(SYNC_TRIGGER, DROP_SYNC_TRIGGER),
+                migrations.RunPython(backfill_status, migrations.RunPython.noop),
+            ],
+        ),
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('status', 7)), fields=['created_at', 'id'], name='users_login_allowed_idx'),
+        ),
+        # Only the model drops the booleans: pods still running the previous
+        # release read and write the columns while this one rolls out
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name='user',
+                    name='users_is_vali_0d788b_idx',
+                ),
+                migrations.RemoveIndex(
+                    model_name='user',
+                    name='users_is_acti_847b48_idx',
+                ),
+                migrations.RemoveIndex(
+                    model_name='user',
+                    name='users_is_enab_c3c6b9_idx',
+                ),
+                migrations.RemoveField(
+                    model_name='user',
+                    name='is_active',
+                ),
+                migrations.RemoveField(
+                    model_name='user',
+                    name='is_deleted',
+                ),
+                migrations.RemoveField(
+                    model_name='user',
+                    name='is_enabled',
+                ),
+                migrations.RemoveField(
+                    model_name='user',
+                    name='is_validated',
+                ),
+            ],
+        ),
+    ]
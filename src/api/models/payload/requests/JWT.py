@@ -1,5 +1,15 @@
-from pydantic import BaseModel
+from pydantic import Field, BaseModel
+
+MAX_BATCH_TOKENS = 500
 
 
 class JWT(BaseModel):
     token: str
+
+
+class BatchJWT(BaseModel):
+    tokens: list[str] = Field(min_length=1, max_length=MAX_BATCH_TOKENS)
+
+
+class RefreshToken(BaseModel):
+    refresh_token: str
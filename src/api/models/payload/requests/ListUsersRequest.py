@@ -0,0 +1,13 @@
+from pydantic import Field, BaseModel
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class ListUsersRequest(BaseModel):
+    cursor: str | None = None
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    is_validated: bool | None = None
+    is_active: bool | None = None
+    is_enabled: bool | None = None
+    is_deleted: bool | None = None
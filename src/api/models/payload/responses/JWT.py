@@ -0,0 +1,20 @@
+from ninja import Schema
+
+
+class JWTDataResponse(Schema):
+    email: str
+    user_id: str
+
+
+class TokenValidationResponse(Schema):
+    is_valid: bool
+    data: JWTDataResponse | None = None
+
+
+class BatchTokenValidationResponse(Schema):
+    results: list[TokenValidationResponse]
+
+
+class TokenPairResponse(Schema):
+    token: str
+    refresh_token: str
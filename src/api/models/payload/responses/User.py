@@ -19,3 +19,26 @@ class UserResponse(ModelSchema):
 class UserLoginResponse(Schema):
     user: UserResponse
     token: str
+    refresh_token: str
+
+
+class UserSummaryResponse(ModelSchema):
+    id: UUID
+    # Read from the model's status bits
+    is_validated: bool
+    is_active: bool
+    is_enabled: bool
+    is_deleted: bool
+
+    class Meta:
+        model = UserModel
+        fields = (
+            "id",
+            "email",
+            "created_at",
+        )
+
+
+class UserPageResponse(Schema):
+    users: list[UserSummaryResponse]
+    next_cursor: str | None = None
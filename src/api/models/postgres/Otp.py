@@ -17,6 +17,7 @@ class Otp(PostgresBaseModel):
         indexes = (
             models.Index(fields=["key"]),
             models.Index(fields=["created_at"]),
+            models.Index(fields=["user", "created_at"]),
         )
 
     def __str__(self) -> str:
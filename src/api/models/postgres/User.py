@@ -1,36 +1,55 @@
 import uuid
+from typing import Any
 
 from django.db import models
 
 from ._base import PostgresBaseModel
+from ._fields import NormalizedEmailField
+from ._status import UserStatus, status_flag
 
 
 class User(PostgresBaseModel):
-    id: models.CharField = models.CharField(
-        max_length=255,
-        primary_key=True,
-        default=uuid.uuid4,  # type: ignore
-    )
+    id: models.UUIDField = models.UUIDField(primary_key=True, default=uuid.uuid4)
     email: models.EmailField = models.EmailField(max_length=255, unique=True)
+    # Every lookup by email goes through this column; see normalize_email
+    email_normalized: NormalizedEmailField = NormalizedEmailField(
+        max_length=255, unique=True, null=True, source="email"
+    )
     password: models.CharField = models.CharField(max_length=255)
     password_reset_token: models.CharField = models.CharField(max_length=255)
     token_expires_at: models.DateTimeField = models.DateTimeField(null=True)
-    is_validated: models.BooleanField = models.BooleanField(default=False)
-    is_active: models.BooleanField = models.BooleanField(default=False)
-    is_enabled: models.BooleanField = models.BooleanField(default=False)
-    is_deleted: models.BooleanField = models.BooleanField(default=False)
+    # UserStatus bits; read and written through the is_* properties below
+    status: models.PositiveSmallIntegerField = models.PositiveSmallIntegerField(
+        default=0
+    )
     created_at: models.DateField = models.DateField(auto_now_add=True)
     last_updated_at: models.DateField = models.DateField(auto_now=True)
 
     class Meta:
         db_table = "users"
         indexes = (
-            models.Index(fields=["is_validated"]),
-            models.Index(fields=["is_active"]),
-            models.Index(fields=["is_enabled"]),
             models.Index(fields=["created_at"]),
             models.Index(fields=["last_updated_at"]),
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["password_reset_token"]),
+            # Pages of accounts that can log in, the common listing filter
+            models.Index(
+                fields=["created_at", "id"],
+                condition=models.Q(status=UserStatus.LOGIN_ALLOWED),
+                name="users_login_allowed_idx",
+            ),
         )
 
+    is_validated = status_flag(UserStatus.VALIDATED)
+    is_active = status_flag(UserStatus.ACTIVE)
+    is_enabled = status_flag(UserStatus.ENABLED)
+    is_deleted = status_flag(UserStatus.DELETED)
+
     def __str__(self) -> str:
-        return self.id
+        return str(self.id)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "email" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "email_normalized"}
+        super().save(*args, **kwargs)
@@ -1,4 +1,6 @@
 from .Otp import Otp
 from .User import User
+from ._status import UserStatus
+from ._projections import PublicUser, UserCredentials
 
-__all__ = ["Otp", "User"]
+__all__ = ["Otp", "PublicUser", "User", "UserCredentials", "UserStatus"]
@@ -1,7 +1,54 @@
+from typing import Any, Self
+from collections.abc import Collection
+
 from django.db import models
 
 
 class PostgresBaseModel(models.Model):
+    """
+    Remembers the column values a row was loaded or last saved with, so
+    repositories can write only the columns that changed.
+    """
+
+    _loaded_values: dict[str, Any]
+
     class Meta:
         app_label = "postgres"
         abstract = True
+
+    def save(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().save(*args, **kwargs)
+        self._loaded_values = self.field_values()
+
+    @classmethod
+    def from_db(
+        cls,
+        db: str | None,
+        field_names: Collection[str],
+        values: Collection[Any],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Self:
+        instance = super().from_db(db, field_names, values, **kwargs)
+        instance._loaded_values = instance.field_values()
+        return instance
+
+    def field_values(self) -> dict[str, Any]:
+        # Deferred columns are absent from __dict__ and never reported dirty
+        return {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    @property
+    def is_tracked(self) -> bool:
+        return not self._state.adding and hasattr(self, "_loaded_values")
+
+    @property
+    def dirty_fields(self) -> list[str]:
+        loaded = getattr(self, "_loaded_values", {})
+        return [
+            name
+            for name, value in self.field_values().items()
+            if name not in loaded or loaded[name] != value
+        ]
@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.db import models
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+class NormalizedEmailField(models.CharField):
+    """Holds normalize_email(<source field>), recomputed on every save."""
+
+    def __init__(self, *args: Any, source: str = "email", **kwargs: Any) -> None:  # noqa: ANN401
+        self.source = source
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> tuple:
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["source"] = self.source
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance: models.Model, add: bool) -> str | None:
+        email = getattr(model_instance, self.source)
+        value = normalize_email(email) if email is not None else None
+        setattr(model_instance, self.attname, value)
+        return value
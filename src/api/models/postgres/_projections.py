@@ -0,0 +1,43 @@
+from uuid import UUID
+from typing import Any, Self, ClassVar
+from datetime import date
+from dataclasses import fields, dataclass
+
+from ._status import UserStatus, status_flag
+
+
+@dataclass(frozen=True, slots=True)
+class PublicUser:
+    """
+    The columns of a user that may leave the service. Immutable, so it can
+    be handed out without copying and never carries the password hash.
+    """
+
+    FIELDS: ClassVar[tuple[str, ...]]
+
+    id: UUID
+    email: str
+    status: int
+    created_at: date
+
+    is_validated = status_flag(UserStatus.VALIDATED)
+    is_active = status_flag(UserStatus.ACTIVE)
+    is_enabled = status_flag(UserStatus.ENABLED)
+    is_deleted = status_flag(UserStatus.DELETED)
+
+    @classmethod
+    def of(cls, source: Any) -> Self:  # noqa: ANN401
+        """Copy this projection's columns off a User or a wider projection."""
+        return cls(**{name: getattr(source, name) for name in cls.FIELDS})
+
+
+@dataclass(frozen=True, slots=True)
+class UserCredentials(PublicUser):
+    """What login and password changes need, including the hash."""
+
+    email_normalized: str | None
+    password: str
+
+
+for projection in (PublicUser, UserCredentials):
+    projection.FIELDS = tuple(field.name for field in fields(projection))
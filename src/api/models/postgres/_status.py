@@ -0,0 +1,34 @@
+from enum import IntFlag
+
+
+class UserStatus(IntFlag):
+    VALIDATED = 1
+    ACTIVE = 2
+    ENABLED = 4
+    DELETED = 8
+
+    # The only status that may log in
+    LOGIN_ALLOWED = VALIDATED | ACTIVE | ENABLED
+
+    @classmethod
+    def matching(cls, set_flags: "UserStatus", unset_flags: "UserStatus") -> list[int]:
+        """Every status value with all of `set_flags` and none of `unset_flags`."""
+        every = cls.VALIDATED | cls.ACTIVE | cls.ENABLED | cls.DELETED
+        return [
+            value
+            for value in range(every + 1)
+            if value & set_flags == set_flags and not value & unset_flags
+        ]
+
+
+def status_flag(flag: UserStatus) -> property:
+    """A boolean view of one bit of the owner's `status` attribute."""
+
+    def get(instance: object) -> bool:
+        return bool(instance.status & flag)  # type: ignore
+
+    def set(instance: object, value: bool) -> None:
+        status = instance.status  # type: ignore
+        instance.status = int(status | flag if value else status & ~flag)  # type: ignore
+
+    return property(get, set)
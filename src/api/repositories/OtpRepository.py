@@ -1,18 +1,20 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
+from asgiref.sync import sync_to_async
 from django.utils import timezone
 
-from src.api.models.postgres import Otp, User
+from src.api.models.postgres import Otp, User, PublicUser
 
 from ._base import BaseRepository
+from ._partitions import DailyPartitions
 
 
 class OtpRepository(BaseRepository[Otp]):
     model = Otp
 
     @classmethod
-    async def add(cls, key: str, user: User | None = None) -> Otp:
-        return await cls.manager.acreate(key=key, user=user)
+    async def add(cls, key: str, user: User | PublicUser | None = None) -> Otp:
+        return await cls.manager.acreate(key=key, user_id=user.id if user else None)
 
     @classmethod
     async def find_by_key(cls, key: str) -> Otp | None:
@@ -25,7 +27,45 @@ class OtpRepository(BaseRepository[Otp]):
         ).afirst()
 
     @classmethod
-    async def find_valid_user_key(cls, user: User, lifetime: timedelta) -> Otp | None:
-        return await cls.manager.filter(
-            user=user, created_at__gte=timezone.now() - lifetime
-        ).afirst()
+    async def find_valid_user_key(
+        cls, user: User | PublicUser, lifetime: timedelta
+    ) -> Otp | None:
+        # A key sent moments ago may not have reached the replicas yet
+        return (
+            await cls.on_primary()
+            .filter(user_id=user.id, created_at__gte=timezone.now() - lifetime)
+            .afirst()
+        )
+
+    @classmethod
+    async def consume_user_key(
+        cls, user: User | PublicUser, key: str, lifetime: timedelta
+    ) -> bool:
+        deleted, _ = await cls.manager.filter(
+            user_id=user.id, key=key, created_at__gte=timezone.now() - lifetime
+        ).adelete()
+        return deleted > 0
+
+    @classmethod
+    async def delete_created_before(cls, before: datetime, batch_size: int) -> int:
+        # Short transactions keep locks and WAL bursts small on large backlogs
+        total = 0
+        while True:
+            pks = cls.manager.filter(created_at__lt=before).values("pk")[:batch_size]
+            deleted, _ = await cls.manager.filter(pk__in=pks).adelete()
+            total += deleted
+            if deleted < batch_size:
+                return total
+
+    @classmethod
+    def partitions(cls) -> DailyPartitions:
+        return DailyPartitions(
+            cls.model._meta.db_table,
+            "created_at",
+            cls.model._meta.pk.column,  # type: ignore
+            cls.db_for_write(),
+        )
+
+    @classmethod
+    async def maintain_partitions(cls, cutoff: datetime, days_ahead: int) -> list[str]:
+        return await sync_to_async(cls.partitions().maintain)(cutoff, days_ahead)
@@ -4,6 +4,7 @@ from datetime import datetime
 from src.api.models.postgres import User
 
 from ._base import BaseRepository
+from .UserRepository import user_cache
 
 
 class PasswordResetRepository(BaseRepository[User]):
@@ -15,4 +16,5 @@ class PasswordResetRepository(BaseRepository[User]):
     ) -> None:
         user.password_reset_token = token
         user.token_expires_at = expires_at
-        await user.asave()
+        if await cls.save_changes(user):
+            await user_cache.invalidate(user)
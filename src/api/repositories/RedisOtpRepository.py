@@ -0,0 +1,52 @@
+from datetime import UTC, datetime, timedelta
+
+from src.env import otp
+from src.utils.otps import OtpStore, StoredOtp
+from src.api.models.postgres import Otp, User, PublicUser
+from src.config.caches.redis import REDIS
+
+otp_store = OtpStore(
+    url=REDIS["LOCATION"],
+    prefix=REDIS["KEY_PREFIX"],
+    lifetime=otp["lifetime"] * 60,
+    max_attempts=otp["max_attempts"],
+)
+
+
+class RedisOtpRepository:
+    """
+    OtpRepository counterpart that keeps OTPs in Redis. Codes expire with
+    their key, so nothing is written to Postgres and nothing needs purging.
+    The returned Otp instances are never saved.
+    """
+
+    @staticmethod
+    def to_otp(user: User | PublicUser, stored: StoredOtp) -> Otp:
+        return Otp(
+            user_id=user.id,
+            key=stored["key"],
+            created_at=datetime.fromtimestamp(stored["created_at"], tz=UTC),
+        )
+
+    @classmethod
+    async def add(cls, key: str, user: User | PublicUser) -> Otp:
+        # Returns the live code instead when a concurrent request issued one
+        return cls.to_otp(user, await otp_store.issue(str(user.id), key))
+
+    @classmethod
+    async def find_valid_user_key(
+        cls, user: User | PublicUser, lifetime: timedelta
+    ) -> Otp | None:
+        stored = await otp_store.get(str(user.id))
+        if not stored:
+            return None
+
+        found = cls.to_otp(user, stored)
+        return found if found.created_at >= datetime.now(UTC) - lifetime else None
+
+    @classmethod
+    async def consume_user_key(
+        cls, user: User | PublicUser, key: str, lifetime: timedelta
+    ) -> bool:
+        # The key's TTL is the lifetime, so only the code needs checking
+        return await otp_store.consume(str(user.id), key)
@@ -1,45 +1,329 @@
-from src.api.models.postgres import User
+from uuid import UUID
+from typing import TypeVar
+from datetime import date, datetime
+from collections.abc import Sequence
+
+from django.db.models import F, Value
+
+from src.env import cache
+from src.api.models.postgres import (
+    Otp,
+    User,
+    PublicUser,
+    UserStatus,
+    UserCredentials,
+)
+from src.config.databases.router import STICKY_WINDOW, stick_to_primary
+from src.api.models.postgres._fields import normalize_email
 from src.api.models.payload.requests.CreateUserRequest import CreateUserRequest
 
-from ._base import BaseRepository
+from ._base import BaseRepository, column
+from ._cache import WRITTEN_TIMEOUT, ModelCache
+from ._identity import get_identity_map
+from ._expressions import Row
+
+USER_CACHE_VERSION = 4
+USER_LOOKUPS = ("id", "email_normalized")
+# Secrets stay in Postgres: the password hash, and the reset token anyone
+# holding can set the password with
+USER_CACHE_FIELDS = (
+    "id",
+    "email",
+    "email_normalized",
+    "status",
+    "created_at",
+    "last_updated_at",
+)
+USER_STATUS_FLAGS = {
+    "is_validated": UserStatus.VALIDATED,
+    "is_active": UserStatus.ACTIVE,
+    "is_enabled": UserStatus.ENABLED,
+    "is_deleted": UserStatus.DELETED,
+}
+
+P = TypeVar("P", bound=PublicUser)
+
+user_cache: ModelCache[User] = ModelCache(
+    User,
+    lookups=USER_LOOKUPS,
+    fields=USER_CACHE_FIELDS,
+    version=USER_CACHE_VERSION,
+    timeout=cache["user_ttl"],
+    # Replicas may still serve the old row; readers of a just-written user
+    # go to the primary instead
+    written_timeout=max(STICKY_WINDOW, WRITTEN_TIMEOUT),
+    on_written=stick_to_primary,
+)
 
 
 class UserRepository(BaseRepository[User]):
     model = User
 
     @classmethod
-    async def add(cls, user_data: CreateUserRequest) -> User:
-        return await cls.manager.acreate(**user_data.model_dump())
+    async def add(cls, user_data: CreateUserRequest) -> User | None:
+        """Returns None when the email is already registered, in any case."""
+        user = await cls.insert_or_ignore(User(**user_data.model_dump()))
+        if not user:
+            return None
+        # Marks the new user as written, so other requests find it on the
+        # primary until the replicas have it
+        await user_cache.invalidate(user)
+        if identity_map := await get_identity_map():
+            identity_map.add(user, USER_LOOKUPS)
+        return user
+
+    @staticmethod
+    def parse_id(id: str | UUID) -> UUID | None:
+        # Ids issued before the UUID migration are the same values as text
+        try:
+            return id if isinstance(id, UUID) else UUID(id)
+        except (TypeError, ValueError):
+            return None
 
     @classmethod
-    async def find_by_id(cls, id: str) -> User | None:
-        return await cls.manager.filter(id=id).afirst()
+    async def find_by_id(cls, id: str | UUID) -> User | None:
+        user_id = cls.parse_id(id)
+        return await cls.find_cached("id", user_id) if user_id else None
 
     @classmethod
     async def find_by_email(cls, email: str) -> User | None:
-        return await cls.manager.filter(email=email).afirst()
+        user = await cls.find_cached("email_normalized", normalize_email(email))
+        if user and user.email == email:
+            return user
+        return await cls.manager.filter(**cls.unnormalized(email)).afirst() or user
+
+    @staticmethod
+    def unnormalized(email: str) -> dict:
+        """
+        Filters for a user with exactly this email and no email_normalized:
+        one written by code that predates the column, or a newer account
+        whose email differs from an older one only by case. Such a user is
+        preferred over the account holding the normalized address.
+        """
+        return {"email": email, "email_normalized__isnull": True}
+
+    @classmethod
+    async def find_public_by_id(cls, id: str | UUID) -> PublicUser | None:
+        user_id = cls.parse_id(id)
+        return await cls.find_projected(PublicUser, "id", user_id) if user_id else None
+
+    @classmethod
+    async def find_public_by_email(cls, email: str) -> PublicUser | None:
+        return await cls.find_projected_by_email(PublicUser, email)
+
+    @classmethod
+    async def find_credentials_by_id(cls, id: str | UUID) -> UserCredentials | None:
+        user_id = cls.parse_id(id)
+        if not user_id:
+            return None
+        return await cls.find_projected(UserCredentials, "id", user_id)
+
+    @classmethod
+    async def find_credentials_by_email(cls, email: str) -> UserCredentials | None:
+        return await cls.find_projected_by_email(UserCredentials, email)
+
+    @classmethod
+    async def find_projected_by_email(cls, projection: type[P], email: str) -> P | None:
+        """find_projected, matching the email like find_by_email."""
+        found = await cls.find_projected(
+            projection, "email_normalized", normalize_email(email)
+        )
+        if found and found.email == email:
+            return found
+        return await cls.query_projected(projection, cls.unnormalized(email)) or found
+
+    @classmethod
+    async def find_projected(
+        cls, projection: type[P], lookup: str, value: object
+    ) -> P | None:
+        """
+        A row already loaded in this request or cached is projected for
+        free; otherwise only the projection's columns are selected. Partial
+        rows are not cached, since the cache holds whole rows.
+        """
+        user = await cls.find_loaded(lookup, value)
+        # Cached rows leave the secrets out
+        if user and not user.get_deferred_fields().intersection(projection.FIELDS):
+            return projection.of(user)
+        return await cls.query_projected(projection, {lookup: value})
+
+    @classmethod
+    async def query_projected(cls, projection: type[P], filters: dict) -> P | None:
+        row = await cls.manager.filter(**filters).values(*projection.FIELDS).afirst()
+        return projection(**row) if row else None
+
+    @classmethod
+    async def find_loaded(cls, lookup: str, value: object) -> User | None:
+        """The user from the identity map or the cache, without a query."""
+        identity_map = await get_identity_map()
+        if identity_map and (user := identity_map.get(User, lookup, value)):
+            return user  # type: ignore
+
+        user = await user_cache.get(lookup, value)
+        if user and identity_map:
+            identity_map.add(user, USER_LOOKUPS)
+        return user
 
     @classmethod
-    async def list(cls, filter: dict = {}) -> list[User]:
-        return [user async for user in cls.manager.filter(**filter)]
+    async def find_cached(cls, lookup: str, value: object) -> User | None:
+        user = await cls.find_loaded(lookup, value)
+        if user:
+            return user
+
+        user = await cls.manager.filter(**{lookup: value}).afirst()
+        if user:
+            await user_cache.set(user)
+            if identity_map := await get_identity_map():
+                identity_map.add(user, USER_LOOKUPS)
+        return user
+
+    @classmethod
+    def resolve_filters(cls, filters: dict) -> dict:
+        """Turn is_* flag filters into one lookup on the status column."""
+        set_flags, unset_flags = UserStatus(0), UserStatus(0)
+        lookups = {}
+        for name, value in filters.items():
+            if name not in USER_STATUS_FLAGS:
+                lookups[name] = value
+            elif value:
+                set_flags |= USER_STATUS_FLAGS[name]
+            else:
+                unset_flags |= USER_STATUS_FLAGS[name]
+
+        if set_flags or unset_flags:
+            statuses = UserStatus.matching(set_flags, unset_flags)
+            # A single value lets the planner use partial indexes on status
+            if len(statuses) == 1:
+                lookups["status"] = statuses[0]
+            else:
+                lookups["status__in"] = statuses
+        return lookups
+
+    @classmethod
+    async def list(
+        cls,
+        filter: dict = {},
+        after: tuple[date, UUID] | None = None,
+        limit: int | None = None,
+    ) -> list[PublicUser]:
+        """Newest first; `after` is the (created_at, id) of the last row seen."""
+        queryset = cls.manager.filter(**cls.resolve_filters(filter)).order_by(
+            "-created_at", "-id"
+        )
+        if after:
+            created_at, id = after
+            queryset = queryset.alias(seek=Row(F("created_at"), F("id"))).filter(
+                seek__lt=Row(Value(created_at), Value(id))
+            )
+        if limit is not None:
+            queryset = queryset[:limit]
+        return [PublicUser(**row) async for row in queryset.values(*PublicUser.FIELDS)]
 
     @classmethod
     async def update_by_user(cls, user: User, updates: dict | None = None) -> User:
         if updates:
             for key, value in updates.items():
                 setattr(user, key, value)
-            await user.asave()
+            if await cls.save_changes(user):
+                await cls.on_updated(user)
         return user
 
     @classmethod
-    async def update_by_id(cls, id: str, updates: dict | None = None) -> User | None:
+    async def update_if(cls, user: User, expected: dict, updates: dict) -> bool:
+        is_updated = await cls.compare_and_set(user, expected, updates)
+        if is_updated:
+            await cls.on_updated(user)
+        return is_updated
+
+    @classmethod
+    async def update_password_if(
+        cls, credentials: UserCredentials, new_password: str
+    ) -> bool:
+        """Replace the hash only while the row still holds `credentials.password`."""
+        updated = await cls.manager.filter(
+            pk=credentials.id, password=credentials.password
+        ).aupdate(password=new_password, **cls.auto_now_values())
+        if not updated:
+            return False
+
+        # Whole rows loaded earlier now hold the old hash
+        await user_cache.invalidate(credentials)  # type: ignore
+        if identity_map := await get_identity_map():
+            identity_map.discard(User, USER_LOOKUPS, credentials)
+        return True
+
+    @classmethod
+    async def on_bulk_updated(cls, instances: Sequence[User]) -> None:
+        await user_cache.invalidate_many(instances)
+
+    @classmethod
+    async def on_updated(cls, user: User) -> None:
+        await user_cache.invalidate(user)
+        if identity_map := await get_identity_map():
+            identity_map.add(user, USER_LOOKUPS)
+
+    @classmethod
+    async def add_status(cls, user: User, flags: UserStatus) -> None:
+        """Set `flags` with an atomic OR, keeping bits others set meanwhile."""
+        await cls.manager.filter(pk=user.pk).aupdate(
+            status=F("status").bitor(int(flags)), **cls.auto_now_values()
+        )
+        user.status |= flags
+        await cls.on_updated(user)
+
+    @classmethod
+    async def update_by_otp(
+        cls, email: str, key: str, since: datetime, flags: UserStatus
+    ) -> User | None:
+        """
+        Consume the user's OTP and set status `flags` in one statement. The
+        OTP row is deleted first, so of two concurrent redemptions only one
+        finds it and updates the user; the other gets None. The user is
+        matched like find_by_email.
+        """
+        users, otps = cls.model._meta, Otp._meta
+        user_fk = column(Otp, "user")
+        status = column(cls.model, "status")
+        normalized = column(cls.model, "email_normalized")
+        email_column = column(cls.model, "email")
+        updates = cls.auto_now_values()
+        assignments = ", ".join(
+            [
+                f'"{status}" = "{status}" | %s',
+                *(f'"{column(cls.model, name)}" = %s' for name in updates),
+            ]
+        )
+
+        query = cls.manager.raw(
+            f"WITH consumed AS ("  # noqa: S608
+            f'DELETE FROM "{otps.db_table}" WHERE "{user_fk}" = '
+            f'(SELECT "{users.pk.column}" FROM "{users.db_table}" WHERE '
+            f'"{normalized}" = %s OR ("{email_column}" = %s AND "{normalized}" IS NULL) '
+            f'ORDER BY "{normalized}" IS NOT NULL LIMIT 1) '
+            f'AND "{column(Otp, "key")}" = %s '
+            f'AND "{column(Otp, "created_at")}" >= %s '
+            f'RETURNING "{user_fk}") '
+            f'UPDATE "{users.db_table}" SET {assignments} '
+            f'WHERE "{users.pk.column}" IN (SELECT "{user_fk}" FROM consumed) '
+            f'RETURNING "{users.db_table}".*',
+            [normalize_email(email), email, key, since, int(flags), *updates.values()],
+            using=cls.db_for_write(),
+        )
+        user = None
+        async for user in query:
+            await cls.on_updated(user)
+        return user
+
+    @classmethod
+    async def update_by_id(
+        cls, id: str | UUID, updates: dict | None = None
+    ) -> User | None:
         user = await UserRepository.find_by_id(id)
         if user and updates:
-            for key, value in updates.items():
-                setattr(user, key, value)
-            await user.asave()
+            await cls.update_by_user(user, updates)
         return user
 
     @classmethod
     async def find_by_reset_token(cls, reset_token: str) -> User | None:
-        return await cls.manager.filter(password_reset_token=reset_token).afirst()
+        # A lagging replica could still hold a token that was already used
+        return await cls.on_primary().filter(password_reset_token=reset_token).afirst()
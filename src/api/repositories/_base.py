@@ -1,14 +1,33 @@
 from typing import Generic, TypeVar
+from datetime import date
+from itertools import islice
+from collections.abc import Iterable, Sequence, AsyncIterator
 
-from django.db.models import Model
-from django.db.models.manager import BaseManager
+from django.db import router, connections
+from django.utils import timezone
+from django.db.models import Field, Model, QuerySet, DateTimeField
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.manager import Manager
+
+from src.api.models.postgres._base import PostgresBaseModel
 
 T = TypeVar("T", bound=Model)
 
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_BATCH_SIZE = 1000
+
+
+def column(model: type[Model], name: str) -> str:
+    """The column field `name` of `model` is stored in, for raw SQL."""
+    field = model._meta.get_field(name)
+    if not isinstance(field, Field) or field.column is None:
+        raise FieldDoesNotExist(f"{model.__name__}.{name} has no column")
+    return field.column
+
 
 class BaseRepository(Generic[T]):
     model: type[T]
-    manager: BaseManager[T]
+    manager: Manager[T]
 
     def __init_subclass__(cls, **kwargs: dict) -> None:
         super().__init_subclass__(**kwargs)
@@ -17,6 +36,169 @@ class BaseRepository(Generic[T]):
 
         cls.manager = cls.model.objects
 
+    @classmethod
+    def db_for_write(cls) -> str:
+        """The primary alias; raw statements that write must name it."""
+        return router.db_for_write(cls.model)
+
+    @classmethod
+    def on_primary(cls) -> QuerySet[T]:
+        """Rows as the primary has them, for reads that must not lag."""
+        return cls.manager.using(cls.db_for_write())
+
+    @classmethod
+    def resolve_filters(cls, filters: dict) -> dict:
+        """Hook to map caller-facing filter names onto column lookups."""
+        return filters
+
     @classmethod
     async def count(cls, filters: dict = {}) -> int:
-        return await cls.manager.filter(**filters).acount()
+        return await cls.manager.filter(**cls.resolve_filters(filters)).acount()
+
+    @classmethod
+    async def stream(
+        cls,
+        filters: dict = {},
+        order_by: tuple[str, ...] = ("pk",),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[T]:
+        """Iterate over a server-side cursor, holding one chunk in memory."""
+        queryset = cls.manager.filter(**cls.resolve_filters(filters)).order_by(
+            *order_by
+        )
+        async for instance in queryset.aiterator(chunk_size=chunk_size):
+            yield instance
+
+    @classmethod
+    async def insert_or_ignore(
+        cls, instance: T, conflict_fields: Sequence[str] = ()
+    ) -> T | None:
+        """
+        INSERT ... ON CONFLICT DO NOTHING RETURNING in one round trip.
+        Returns the stored row, or None when it collided with an existing
+        one on `conflict_fields` (any unique constraint when empty).
+        """
+        meta = cls.model._meta
+        using = cls.db_for_write()
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        fields = meta.concrete_fields
+        values = [
+            field.get_db_prep_save(field.pre_save(instance, add=True), connection)
+            for field in fields
+        ]
+
+        conflict_target = (
+            f"({', '.join(quote(column(cls.model, name)) for name in conflict_fields)})"
+            if conflict_fields
+            else ""
+        )
+
+        query = cls.manager.raw(
+            f"INSERT INTO {quote(meta.db_table)} "  # noqa: S608
+            f"({', '.join(quote(column(cls.model, field.name)) for field in fields)}) "
+            f"VALUES ({', '.join(['%s'] * len(fields))}) "
+            f"ON CONFLICT {conflict_target} DO NOTHING RETURNING *",
+            values,
+            using=using,
+        )
+        async for stored in query:
+            return stored
+        return None
+
+    @classmethod
+    async def bulk_add(
+        cls,
+        instances: Iterable[T],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        ignore_conflicts: bool = False,
+    ) -> int:
+        added = 0
+        iterator = iter(instances)
+        while batch := list(islice(iterator, batch_size)):
+            created = await cls.manager.abulk_create(
+                batch, ignore_conflicts=ignore_conflicts
+            )
+            added += len(created)
+        return added
+
+    @classmethod
+    async def bulk_update(
+        cls,
+        instances: Iterable[T],
+        fields: list[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        fields = [*fields, *cls.auto_now_fields()]
+        auto_now_values = cls.auto_now_values()
+
+        updated = 0
+        iterator = iter(instances)
+        while batch := list(islice(iterator, batch_size)):
+            for instance in batch:
+                for name, value in auto_now_values.items():
+                    setattr(instance, name, value)
+            updated += await cls.manager.abulk_update(batch, fields)
+            await cls.on_bulk_updated(batch)
+        return updated
+
+    @classmethod
+    async def on_bulk_updated(cls, instances: Sequence[T]) -> None:
+        pass
+
+    @classmethod
+    def auto_now_fields(cls) -> list[str]:
+        return [
+            field.name
+            for field in cls.model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+
+    @classmethod
+    def auto_now_values(cls) -> dict[str, date]:
+        now = timezone.now()
+        return {
+            name: now
+            if isinstance(cls.model._meta.get_field(name), DateTimeField)
+            else now.date()
+            for name in cls.auto_now_fields()
+        }
+
+    @classmethod
+    async def save_changes(cls, instance: T) -> bool:
+        """Write only the changed columns; returns False when nothing changed."""
+        if not isinstance(instance, PostgresBaseModel) or not instance.is_tracked:
+            await instance.asave()
+            return True
+
+        dirty_fields = instance.dirty_fields
+        if not dirty_fields:
+            return False
+
+        update_fields = {instance._meta.get_field(name).name for name in dirty_fields}
+        await instance.asave(update_fields=[*update_fields, *cls.auto_now_fields()])
+        return True
+
+    @classmethod
+    async def compare_and_set(cls, instance: T, expected: dict, updates: dict) -> bool:
+        """
+        UPDATE the row only while its columns still hold `expected`.
+        The instance is updated only when the row was.
+        """
+        updates = {**cls.auto_now_values(), **updates}
+        updated = await cls.manager.filter(pk=instance.pk, **expected).aupdate(
+            **updates
+        )
+        if not updated:
+            return False
+
+        for key, value in updates.items():
+            setattr(instance, key, value)
+        if isinstance(instance, PostgresBaseModel) and instance.is_tracked:
+            # Only the updated columns are clean; other edits still need saving
+            current = instance.field_values()
+            for key in updates:
+                field = instance._meta.get_field(key)
+                attname = field.attname if isinstance(field, Field) else key
+                instance._loaded_values[attname] = current[attname]
+        return True
@@ -0,0 +1,118 @@
+import math
+from typing import Generic, TypeVar, TypedDict
+from collections.abc import Callable, Sequence
+
+from django.db.models import Model
+from django.core.cache import cache
+
+T = TypeVar("T", bound=Model)
+
+# Left in place of a row that was just written, see `written_timeout`
+WRITTEN = "written"
+
+# Outlasts a read that fetched the row just before it was written
+WRITTEN_TIMEOUT = 5
+
+
+class ModelCacheStats(TypedDict):
+    hits: int
+    misses: int
+    errors: int
+    invalidations: int
+
+
+class ModelCache(Generic[T]):
+    """
+    Read-through cache of model rows in the default (Redis) cache.
+
+    Rows are stored as a tuple of the `fields` columns (every concrete one
+    by default) and rebuilt with `Model.from_db`, so cached instances can be
+    saved like fetched ones; columns left out come back deferred. Bump
+    `version` whenever the projection changes; cache errors fall through to
+    the database.
+
+    Invalidated keys hold a marker for `written_timeout` seconds instead of
+    being deleted, and rows are only cached where no key exists. A reader
+    that fetched the row before a write, or a lagging replica, therefore
+    cannot put the old row back. Reading a marker calls `on_written`, and so
+    does a failed read, since the marker may be what could not be read.
+    """
+
+    def __init__(
+        self,
+        model: type[T],
+        lookups: tuple[str, ...],
+        version: int,
+        timeout: int,
+        written_timeout: float = WRITTEN_TIMEOUT,
+        on_written: Callable[[], None] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> None:
+        self.model = model
+        self.lookups = lookups
+        self.version = version
+        self.timeout = timeout
+        # The cache keeps whole seconds, and 0 would delete the marker
+        self.written_timeout = max(math.ceil(written_timeout), 1)
+        self.on_written = on_written
+        self.fields = list(
+            fields or [field.attname for field in model._meta.concrete_fields]
+        )
+        self.namespace = model._meta.db_table
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._invalidations = 0
+
+    def key(self, lookup: str, value: object) -> str:
+        return f"{self.namespace}:{lookup}:{value}"
+
+    def keys(self, instance: T) -> list[str]:
+        return [self.key(lookup, getattr(instance, lookup)) for lookup in self.lookups]
+
+    async def get(self, lookup: str, value: object) -> T | None:
+        try:
+            row = await cache.aget(self.key(lookup, value), version=self.version)
+        except Exception:
+            self._errors += 1
+            row = WRITTEN
+
+        if row is None or row == WRITTEN:
+            self._misses += 1
+            if row == WRITTEN and self.on_written:
+                self.on_written()
+            return None
+
+        self._hits += 1
+        return self.model.from_db(None, self.fields, row)
+
+    async def set(self, instance: T) -> None:
+        row = tuple(getattr(instance, field) for field in self.fields)
+        try:
+            for key in self.keys(instance):
+                await cache.aadd(key, row, timeout=self.timeout, version=self.version)
+        except Exception:
+            self._errors += 1
+
+    async def invalidate(self, instance: T) -> None:
+        await self.invalidate_many([instance])
+
+    async def invalidate_many(self, instances: Sequence[T]) -> None:
+        self._invalidations += len(instances)
+        keys = [key for instance in instances for key in self.keys(instance)]
+        try:
+            await cache.aset_many(
+                dict.fromkeys(keys, WRITTEN),
+                timeout=self.written_timeout,
+                version=self.version,
+            )
+        except Exception:
+            self._errors += 1
+
+    def stats(self) -> ModelCacheStats:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "errors": self._errors,
+            "invalidations": self._invalidations,
+        }
@@ -0,0 +1,13 @@
+from django.db.models import F, Func, Field, Expression
+
+
+class Row(Func):
+    """
+    Postgres row constructor. Comparing two rows, e.g. `(created_at, id) <
+    (%s, %s)`, lets a composite index serve keyset pagination directly.
+    """
+
+    function = "ROW"
+
+    def __init__(self, *expressions: Expression | F) -> None:
+        super().__init__(*expressions, output_field=Field())
@@ -0,0 +1,52 @@
+from typing import TypedDict
+
+from django.db.models import Model
+
+from src.utils.svcs import Service, ADepends, context
+
+
+class IdentityMapStats(TypedDict):
+    maps: int
+    hits: int
+    misses: int
+
+
+identity_map_stats: IdentityMapStats = {"maps": 0, "hits": 0, "misses": 0}
+
+
+@Service()
+class IdentityMap:
+    """
+    Entities loaded during one request, keyed by model and lookup value.
+
+    Each request's svcs container holds its own map, so a row is fetched
+    at most once per request and every caller shares the same instance.
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[tuple[type[Model], str, str], Model] = {}
+        identity_map_stats["maps"] += 1
+
+    def get(self, model: type[Model], lookup: str, value: object) -> Model | None:
+        entity = self._entities.get((model, lookup, str(value)))
+        identity_map_stats["hits" if entity else "misses"] += 1
+        return entity
+
+    def add(self, entity: Model, lookups: tuple[str, ...]) -> None:
+        model = type(entity)
+        for lookup in lookups:
+            self._entities[(model, lookup, str(getattr(entity, lookup)))] = entity
+
+    def discard(
+        self, model: type[Model], lookups: tuple[str, ...], row: object
+    ) -> None:
+        """Forget the entity `row` identifies, e.g. after a write bypassed it."""
+        for lookup in lookups:
+            self._entities.pop((model, lookup, str(getattr(row, lookup))), None)
+
+
+async def get_identity_map() -> IdentityMap | None:
+    # Outside a request there is no container scoped to a unit of work
+    if context.request.get() is None:
+        return None
+    return await ADepends(IdentityMap)
@@ -0,0 +1,209 @@
+import zlib
+from datetime import date, datetime, timedelta
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+
+class DailyPartitions:
+    """
+    Daily range partitions of `table` on `column`, named `<table>_pYYYYMMDD`,
+    plus a default partition that only catches rows outside every range.
+    Expired data is removed by dropping whole partitions.
+    """
+
+    def __init__(self, table: str, column: str, pk: str, using: str) -> None:
+        self.table = table
+        self.column = column
+        self.pk = pk
+        self.using = using
+        self.default = f"{table}_default"
+        # Serializes partition DDL between workers
+        self.lock_id = zlib.crc32(f"partitions:{table}".encode())
+
+    def partition_name(self, day: date) -> str:
+        return f"{self.table}_p{day:%Y%m%d}"
+
+    def is_partitioned(self) -> bool:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                "SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(%s)",
+                [self.table],
+            )
+            row = cursor.fetchone()
+        return bool(row and row[0])
+
+    def partitions(self) -> list[str]:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(%s)",
+                [self.table],
+            )
+            return [name for (name,) in cursor.fetchall()]
+
+    def create(
+        self, first_day: date, last_day: date, parent: str | None = None
+    ) -> None:
+        parent = parent or self.table
+        with connections[self.using].cursor() as cursor:
+            day = first_day
+            while day <= last_day:
+                name = self.partition_name(day)
+                bounds = [day.isoformat(), (day + timedelta(days=1)).isoformat()]
+                cursor.execute("SELECT to_regclass(%s) IS NULL", [name])
+                is_missing = cursor.fetchone()[0]
+                if is_missing and self.default_holds(bounds):
+                    self.create_from_default(name, parent, bounds)
+                elif is_missing:
+                    cursor.execute(
+                        f"CREATE TABLE {name} PARTITION OF {parent} "
+                        "FOR VALUES FROM (%s) TO (%s)",
+                        bounds,
+                    )
+                day += timedelta(days=1)
+
+    def default_holds(self, bounds: list[str]) -> bool:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s) IS NULL", [self.default])
+            if cursor.fetchone()[0]:
+                return False
+            cursor.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {self.default} "  # noqa: S608
+                f"WHERE {self.column} >= %s AND {self.column} < %s)",
+                bounds,
+            )
+            return cursor.fetchone()[0]
+
+    def create_from_default(self, name: str, parent: str, bounds: list[str]) -> None:
+        """
+        Create a partition for a range the default partition holds rows of.
+        Postgres refuses to add such a partition, so the rows are moved into
+        the new table before it is attached.
+        """
+        with (
+            transaction.atomic(using=self.using),
+            connections[self.using].cursor() as cursor,
+        ):
+            # Keeps inserts out of the default until the range has a partition
+            cursor.execute(f"LOCK TABLE {self.default} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(
+                f"CREATE TABLE {name} "
+                f"(LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {self.default} "  # noqa: S608
+                f"WHERE {self.column} >= %s AND {self.column} < %s RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved",
+                bounds,
+            )
+            cursor.execute(
+                f"ALTER TABLE {parent} ATTACH PARTITION {name} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                bounds,
+            )
+
+    def drop_before(self, cutoff: datetime) -> list[str]:
+        prefix = f"{self.table}_p"
+        dropped = []
+        with connections[self.using].cursor() as cursor:
+            for name in self.partitions():
+                suffix = name.removeprefix(prefix)
+                if name == suffix or not suffix.isdigit():
+                    continue
+                # A partition goes only once every row it can hold has expired
+                day = datetime.strptime(suffix, "%Y%m%d").replace(tzinfo=cutoff.tzinfo)
+                if day + timedelta(days=1) <= cutoff:
+                    cursor.execute(f"DROP TABLE {name}")
+                    dropped.append(name)
+        return dropped
+
+    def maintain(self, cutoff: datetime, days_ahead: int) -> list[str]:
+        if not self.is_partitioned():
+            return []
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [self.lock_id])
+            if not cursor.fetchone()[0]:
+                return []
+            try:
+                # Rows back to the cutoff may sit in the default partition
+                today = timezone.now().date()
+                self.create(cutoff.date(), today + timedelta(days=days_ahead))
+                return self.drop_before(cutoff)
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [self.lock_id])
+
+    def convert(self, cutoff: datetime, days_ahead: int) -> int:
+        """
+        Rebuild the table as a partitioned one, keeping rows newer than
+        `cutoff`. Runs in one transaction under an exclusive lock; the
+        existing indexes and foreign keys are recreated under their names.
+        """
+        staging = f"{self.table}_partitioned"
+        with (
+            transaction.atomic(using=self.using),
+            connections[self.using].cursor() as cursor,
+        ):
+            cursor.execute(f"LOCK TABLE {self.table} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE schemaname = current_schema() "
+                "AND tablename = %s AND indexname <> %s",
+                [self.table, f"{self.table}_pkey"],
+            )
+            indexes = [definition for (definition,) in cursor.fetchall()]
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+                [self.table],
+            )
+            foreign_keys = cursor.fetchall()
+
+            cursor.execute(
+                f"CREATE TABLE {staging} (LIKE {self.table} INCLUDING DEFAULTS "
+                f"INCLUDING IDENTITY) PARTITION BY RANGE ({self.column})"
+            )
+            # Unique constraints on a partitioned table must cover the range key
+            cursor.execute(
+                f"ALTER TABLE {staging} ADD CONSTRAINT {staging}_pkey "
+                f"PRIMARY KEY ({self.pk}, {self.column})"
+            )
+            cursor.execute(
+                f"CREATE TABLE {self.default} PARTITION OF {staging} DEFAULT"
+            )
+            # Every copied row gets a daily partition, leaving the default empty
+            today = timezone.now().date()
+            self.create(
+                cutoff.date(), today + timedelta(days=days_ahead), parent=staging
+            )
+            cursor.execute(
+                f"INSERT INTO {staging} SELECT * FROM {self.table} "  # noqa: S608
+                f"WHERE {self.column} >= %s",
+                [cutoff],
+            )
+            copied = cursor.rowcount
+            # Continue ids after every row ever issued, copied or not
+            cursor.execute(
+                f"SELECT coalesce(max({self.pk}), 0) + 1 FROM {self.table}"  # noqa: S608
+            )
+            cursor.execute(
+                "SELECT setval(pg_get_serial_sequence(%s, %s), %s, false)",
+                [staging, self.pk, cursor.fetchone()[0]],
+            )
+
+            cursor.execute(f"DROP TABLE {self.table}")
+            cursor.execute(f"ALTER TABLE {staging} RENAME TO {self.table}")
+            cursor.execute(
+                f"ALTER TABLE {self.table} RENAME CONSTRAINT {staging}_pkey "
+                f"TO {self.table}_pkey"
+            )
+            for definition in indexes:
+                cursor.execute(definition)
+            for name, definition in foreign_keys:
+                cursor.execute(
+                    f"ALTER TABLE {self.table} ADD CONSTRAINT {name} {definition}"
+                )
+
+        # Rows outside every range land in the default partition and are purged
+        # by row deletes until maintain gives their day a partition
+        return copied
@@ -0,0 +1,55 @@
+from typing import TypedDict
+
+from django.db import connections
+
+
+class PoolStats(TypedDict):
+    enabled: bool
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    available: int
+    waiting: int
+    checkouts: int
+    checkout_errors: int
+    avg_checkout_ms: float
+    connections_lost: int
+
+
+def pool_stats(alias: str) -> PoolStats:
+    """Counters of the connection pool behind `alias`, since the worker started."""
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return {
+            "enabled": False,
+            "min_size": 0,
+            "max_size": 0,
+            "size": 0,
+            "in_use": 0,
+            "available": 0,
+            "waiting": 0,
+            "checkouts": 0,
+            "checkout_errors": 0,
+            "avg_checkout_ms": 0.0,
+            "connections_lost": 0,
+        }
+
+    # Counters that never moved are left out by psycopg_pool
+    stats = pool.get_stats()
+    checkouts = stats.get("requests_num", 0)
+    return {
+        "enabled": True,
+        "min_size": stats["pool_min"],
+        "max_size": stats["pool_max"],
+        "size": stats["pool_size"],
+        "in_use": stats["pool_size"] - stats["pool_available"],
+        "available": stats["pool_available"],
+        "waiting": stats["requests_waiting"],
+        "checkouts": checkouts,
+        "checkout_errors": stats.get("requests_errors", 0),
+        "avg_checkout_ms": (
+            stats.get("requests_wait_ms", 0) / checkouts if checkouts else 0.0
+        ),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
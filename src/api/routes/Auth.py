@@ -5,7 +5,11 @@ from django.http import HttpRequest
 
 from src.utils.svcs import ADepends
 from src.api.controllers.AuthController import AuthController
-from src.api.models.payload.requests.JWT import JWT
+from src.api.models.payload.requests.JWT import JWT, BatchJWT, RefreshToken
+from src.api.models.payload.responses.JWT import (
+    TokenPairResponse,
+    BatchTokenValidationResponse,
+)
 from src.api.models.payload.responses.User import UserResponse, UserLoginResponse
 from src.api.models.payload.requests.ResendUserOtp import ResendUserOtp
 from src.api.models.payload.responses.ErrorResponse import (
@@ -92,6 +96,71 @@ async def validate_jwt_token(request: HttpRequest, credentials: JWT) -> tuple:
     return await auth_controller.validate_token(credentials)
 
 
+@router.post(
+    "/validate-token/batch",
+    response={
+        HTTPStatus.OK: SuccessResponse[BatchTokenValidationResponse],
+        HTTPStatus.BAD_REQUEST: ErrorResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def validate_jwt_tokens(request: HttpRequest, credentials: BatchJWT) -> tuple:
+    auth_controller = await ADepends(AuthController)
+    return await auth_controller.validate_tokens(credentials)
+
+
+@router.post(
+    "/token/revoke",
+    response={
+        HTTPStatus.OK: SuccessResponse,
+        HTTPStatus.BAD_REQUEST: ErrorResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def revoke_jwt_token(request: HttpRequest, credentials: JWT) -> tuple:
+    auth_controller = await ADepends(AuthController)
+    return await auth_controller.revoke_token(credentials)
+
+
+@router.post(
+    "/token/refresh",
+    response={
+        HTTPStatus.OK: SuccessResponse[TokenPairResponse],
+        HTTPStatus.UNAUTHORIZED: ErrorResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def refresh_jwt_token(request: HttpRequest, credentials: RefreshToken) -> tuple:
+    auth_controller = await ADepends(AuthController)
+    return await auth_controller.refresh_token(credentials)
+
+
+@router.post(
+    "/logout",
+    response={
+        HTTPStatus.OK: SuccessResponse,
+        HTTPStatus.UNAUTHORIZED: ErrorResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def logout(request: HttpRequest, credentials: RefreshToken) -> tuple:
+    auth_controller = await ADepends(AuthController)
+    return await auth_controller.logout(credentials)
+
+
+@router.post(
+    "/logout/all",
+    response={
+        HTTPStatus.OK: SuccessResponse,
+        HTTPStatus.UNAUTHORIZED: ErrorResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def logout_all(request: HttpRequest, credentials: RefreshToken) -> tuple:
+    auth_controller = await ADepends(AuthController)
+    return await auth_controller.logout_all(credentials)
+
+
 @router.put(
     "/change-password",
     response={
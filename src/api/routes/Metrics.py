@@ -0,0 +1,23 @@
+from http import HTTPStatus
+
+from ninja import Router
+from django.http import HttpRequest
+
+from src.utils.svcs import ADepends
+from src.api.controllers.MetricsController import MetricsController
+from src.api.models.payload.responses.ErrorResponse import ServerErrorResponse
+from src.api.models.payload.responses.SuccessResponse import SuccessResponse
+
+router = Router()
+
+
+@router.get(
+    "/",
+    response={
+        HTTPStatus.OK: SuccessResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def get_metrics(request: HttpRequest) -> tuple:
+    metrics_controller = await ADepends(MetricsController)
+    return await metrics_controller.get_metrics()
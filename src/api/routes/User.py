@@ -0,0 +1,33 @@
+from http import HTTPStatus
+
+from ninja import Query, Router
+from django.http import HttpRequest
+
+from src.utils.svcs import ADepends
+from src.api.middlewares.AppMiddleware import admin_authentication
+from src.api.controllers.UserController import UserController
+from src.api.models.payload.responses.User import UserPageResponse
+from src.api.models.payload.responses.ErrorResponse import (
+    ErrorResponse,
+    ServerErrorResponse,
+)
+from src.api.models.payload.requests.ListUsersRequest import ListUsersRequest
+from src.api.models.payload.responses.SuccessResponse import SuccessResponse
+
+router = Router()
+
+
+@router.get(
+    "/",
+    auth=admin_authentication,
+    response={
+        HTTPStatus.OK: SuccessResponse[UserPageResponse],
+        HTTPStatus.BAD_REQUEST: ErrorResponse,
+        HTTPStatus.UNAUTHORIZED: ErrorResponse,
+        HTTPStatus.FORBIDDEN: ErrorResponse,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ServerErrorResponse,
+    },
+)
+async def list_users(request: HttpRequest, filters: Query[ListUsersRequest]) -> tuple:
+    user_controller = await ADepends(UserController)
+    return await user_controller.list_users(filters)
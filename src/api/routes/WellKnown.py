@@ -0,0 +1,13 @@
+from ninja import Router
+from django.http import HttpRequest, HttpResponse
+
+from src.utils.svcs import ADepends
+from src.api.controllers.WellKnownController import WellKnownController
+
+router = Router()
+
+
+@router.get("/jwks.json", auth=None)
+async def get_jwks(request: HttpRequest) -> HttpResponse:
+    well_known_controller = await ADepends(WellKnownController)
+    return await well_known_controller.get_jwks(request)
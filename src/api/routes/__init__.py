@@ -19,7 +19,12 @@ original_get_openapi_schema = api.get_openapi_schema
 def custom_openapi_schema(path_params: dict | None = None) -> OpenAPISchema:
     schema = original_get_openapi_schema()
 
+    schemes = schema["components"].get("securitySchemes", {})
     schema["components"]["securitySchemes"] = {
+        # Bearer schemes of routes with their own auth
+        **{
+            name: scheme for name, scheme in schemes.items() if scheme["type"] == "http"
+        },
         "API Timestamp": {
             "type": "apiKey",
             "in": "header",
@@ -57,3 +62,6 @@ api.add_router("/auth", "src.api.routes.Auth.router", tags=["Auth"])
 api.add_router(
     "/auth/password/reset", "src.api.routes.PasswordReset.router", tags=["Password"]
 )
+api.add_router("/users", "src.api.routes.User.router", tags=["Users"])
+api.add_router("/.well-known", "src.api.routes.WellKnown.router", tags=["Keys"])
+api.add_router("/metrics", "src.api.routes.Metrics.router", tags=["Metrics"])
@@ -1,15 +1,19 @@
+import asyncio
 from typing import Annotated
 
 from src.utils.svcs import Service
 from src.config.asgi import broker
 from src.utils.logger import Logger
-from src.api.typing.JWT import JWTSuccess
+from src.api.typing.JWT import JWTData, JWTSuccess, TokenValidation
+from src.utils.executor import ExecutorRejectedError
+from src.api.typing.Session import SessionTokens
+from src.api.models.postgres import UserStatus, UserCredentials
 from src.api.constants.queues import QUEUE_NAMES
 from src.api.typing.UserExists import UserExists
 from src.api.constants.messages import MESSAGES, DYNAMIC_MESSAGES
 from src.api.typing.UserSuccess import UserSuccess
 from src.api.constants.activity_types import ACTIVITY_TYPES
-from src.api.models.payload.requests.JWT import JWT
+from src.api.models.payload.requests.JWT import JWT, BatchJWT, RefreshToken
 from src.api.repositories.UserRepository import UserRepository
 from src.api.models.payload.requests.ResendUserOtp import ResendUserOtp
 from src.api.models.payload.requests.CreateUserRequest import CreateUserRequest
@@ -22,6 +26,7 @@ from src.api.models.payload.requests.ChangeUserPasswordRequest import (
 )
 
 from .OtpService import OtpService
+from .SessionService import SessionService
 from .UtilityService import UtilityService
 
 
@@ -31,43 +36,41 @@ class AuthService:
         self,
         logger: Annotated[Logger, "AuthService"],
         otp_service: OtpService,
+        session_service: SessionService,
         utility_service: UtilityService,
     ) -> None:
         self.logger = logger
         self.otp_service = otp_service
+        self.session_service = session_service
         self.utility_service = utility_service
 
     async def register(self, req: CreateUserRequest) -> UserExists:
         email = req.email
         password = req.password
 
-        existing_user = await UserRepository.find_by_email(email)
-        if existing_user:
+        # Hash before inserting so that the insert decides, in one statement,
+        # whether the email is taken
+        hashed_password: str = await self.utility_service.hash_string(password)
+        req = req.model_copy(update={"password": hashed_password})
+
+        created_user = await UserRepository.add(req)
+        if not created_user:
             message = MESSAGES["REGISTRATION"]["EMAIL_EXISTS"]
             self.logger.info(
                 {
                     "activity_type": ACTIVITY_TYPES["USER_REGISTRATION"],
                     "message": message,
-                    "metadata": {"user": {"email": existing_user.email}},
+                    "metadata": {"user": {"email": email}},
                 }
             )
-            return {
-                "is_exists": True,
-                "user": existing_user,
-                "message": message,
-            }
-
-        hashed_password: str = await self.utility_service.hash_string(password)
-        req = req.model_copy(update={"password": hashed_password})
-
-        created_user = await UserRepository.add(req)
+            return {"is_exists": True, "message": message}
 
-        user_data = {"id": created_user.id, "email": created_user.email}
+        user_data = {"id": str(created_user.id), "email": created_user.email}
         queue = QUEUE_NAMES["USER_REGISTRATION"]
 
         await broker.publish(message=user_data, queue=queue, persist=True)
 
-        await self.otp_service.send_otp(created_user.id)
+        await self.otp_service.send_otp(str(created_user.id))
 
         user = self.utility_service.sanitize_user_object(created_user)
 
@@ -88,7 +91,7 @@ class AuthService:
     async def resend_email(self, req: ResendUserOtp) -> UserSuccess:
         email = req.email
 
-        user = await UserRepository.find_by_email(email)
+        user = await UserRepository.find_public_by_email(email)
         if not user:
             self.logger.error(
                 {
@@ -99,7 +102,7 @@ class AuthService:
             )
             return {"is_success": False, "message": MESSAGES["USER"]["DOESNT_EXIST"]}
 
-        otp_success = await self.otp_service.send_otp(user.id)
+        otp_success = await self.otp_service.send_otp(str(user.id))
         return {
             "is_success": otp_success["is_success"],
             "message": otp_success["message"],
@@ -109,26 +112,13 @@ class AuthService:
         email = req.email
         otp = req.otp
 
-        user = await UserRepository.find_by_email(email)
+        user = await self.otp_service.redeem_otp(
+            email, otp, UserStatus.VALIDATED | UserStatus.ACTIVE | UserStatus.ENABLED
+        )
         if not user:
-            self.logger.error(
-                {
-                    "activity_type": ACTIVITY_TYPES["EMAIL_VALIDATION"],
-                    "message": MESSAGES["USER"]["DOESNT_EXIST"],
-                    "metadata": {"email": email, "otp": otp},
-                }
-            )
-            return False
-
-        is_valid = await self.otp_service.validate_otp(user.id, otp)
-        if not is_valid:
             return False
 
-        await UserRepository.update_by_user(
-            user, {"is_active": True, "is_enabled": True, "is_validated": True}
-        )
-
-        user_data = {"id": user.id, "email": user.email}
+        user_data = {"id": str(user.id), "email": user.email}
         queue = QUEUE_NAMES["EMAIL_VALIDATION"]
         await broker.publish(message=user_data, queue=queue, persist=True)
 
@@ -138,7 +128,7 @@ class AuthService:
         email = req.email
         password = req.password
 
-        existing_user = await UserRepository.find_by_email(email)
+        existing_user = await UserRepository.find_credentials_by_email(email)
         if not existing_user:
             message = MESSAGES["AUTH"]["INVALID_CRED"]
             self.logger.info(
@@ -164,52 +154,16 @@ class AuthService:
             )
             return {"is_success": False, "message": message}
 
-        if not existing_user.is_validated:
-            await self.otp_service.send_otp(existing_user.id)
-
-            message = MESSAGES["AUTH"]["NOT_VALIDATED"]
-            self.logger.info(
-                {
-                    "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
-                    "message": message,
-                    "metadata": req.model_dump(),
-                }
-            )
-            return {
-                "is_success": False,
-                "message": message,
-            }
-
-        if not existing_user.is_active:
-            message = MESSAGES["AUTH"]["NOT_ACTIVE"]
-            self.logger.info(
-                {
-                    "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
-                    "message": message,
-                    "metadata": req.model_dump(),
-                }
-            )
-            return {
-                "is_success": False,
-                "message": message,
-            }
+        if self.utility_service.needs_rehash(existing_user.password):
+            await self.rehash_password(existing_user, password)
 
-        if not existing_user.is_enabled:
-            message = MESSAGES["AUTH"]["NOT_ENABLED"]
-            self.logger.info(
-                {
-                    "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
-                    "message": message,
-                    "metadata": req.model_dump(),
-                }
-            )
-            return {
-                "is_success": False,
-                "message": message,
-            }
+        # One comparison on the happy path; the reason is only worked out
+        # for accounts that are turned away
+        if existing_user.status != UserStatus.LOGIN_ALLOWED:
+            if not existing_user.is_validated:
+                await self.otp_service.send_otp(str(existing_user.id))
 
-        if existing_user.is_deleted:
-            message = MESSAGES["AUTH"]["IS_DELETED"]
+            message = self.login_denied_message(existing_user)
             self.logger.info(
                 {
                     "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
@@ -231,7 +185,7 @@ class AuthService:
             }
         )
 
-        jwt_details = self.utility_service.generate_jwt(user.email, user.id)
+        session = await self.session_service.start(user.email, str(user.id))
         self.logger.info(
             {
                 "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
@@ -244,11 +198,52 @@ class AuthService:
             "is_success": True,
             "message": MESSAGES["AUTH"]["SUCCESS"],
             "user": user,
-            "token": jwt_details,
+            "token": session["token"],
+            "refresh_token": session["refresh_token"],
         }
 
+    @staticmethod
+    def login_denied_message(user: UserCredentials) -> str:
+        if not user.is_validated:
+            return MESSAGES["AUTH"]["NOT_VALIDATED"]
+        if not user.is_active:
+            return MESSAGES["AUTH"]["NOT_ACTIVE"]
+        if not user.is_enabled:
+            return MESSAGES["AUTH"]["NOT_ENABLED"]
+        return MESSAGES["AUTH"]["IS_DELETED"]
+
+    async def rehash_password(self, user: UserCredentials, password: str) -> None:
+        try:
+            new_password_hash = await self.utility_service.hash_string(password)
+        except ExecutorRejectedError as exc:
+            # The login itself already succeeded; retry the upgrade next time
+            self.logger.warn(
+                {
+                    "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
+                    "message": str(exc),
+                    "metadata": {"user": {"id": user.id}},
+                }
+            )
+            return
+
+        # A password changed since this login was checked must not be overwritten
+        is_rehashed = await UserRepository.update_password_if(user, new_password_hash)
+        if not is_rehashed:
+            return
+
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["USER_LOGIN"],
+                "message": MESSAGES["USER"]["PASSWORD_REHASHED"],
+                "metadata": {"user": {"id": user.id}},
+            }
+        )
+
+    async def verify_token(self, token: str) -> JWTData | None:
+        return await self.utility_service.adecrypt_jwt(token)
+
     async def validate_token(self, req: JWT) -> JWTSuccess:
-        data = self.utility_service.decrypt_jwt(req.token)
+        data = await self.verify_token(req.token)
         if not data:
             message = MESSAGES["AUTH"]["TOKEN_ERROR"]
             self.logger.info(
@@ -270,10 +265,94 @@ class AuthService:
         )
         return {"is_success": True, "message": message, "data": data}
 
+    async def revoke_token(self, req: JWT) -> UserSuccess:
+        is_revoked = await self.utility_service.revoke_jwt(req.token)
+        message = MESSAGES["AUTH"]["TOKEN_REVOKED" if is_revoked else "TOKEN_ERROR"]
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["REVOKE_TOKEN"],
+                "message": message,
+                "metadata": {},
+            }
+        )
+        return {"is_success": is_revoked, "message": message}
+
+    async def refresh_token(self, req: RefreshToken) -> SessionTokens | None:
+        session = await self.session_service.refresh(req.refresh_token)
+        message = MESSAGES["AUTH"]["TOKEN_REFRESHED" if session else "TOKEN_ERROR"]
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["REFRESH_TOKEN"],
+                "message": message,
+                "metadata": {},
+            }
+        )
+        return session
+
+    async def logout(self, req: RefreshToken) -> UserSuccess:
+        is_ended = await self.session_service.end(req.refresh_token)
+        message = MESSAGES["AUTH"]["LOGGED_OUT" if is_ended else "TOKEN_ERROR"]
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["USER_LOGOUT"],
+                "message": message,
+                "metadata": {},
+            }
+        )
+        return {"is_success": is_ended, "message": message}
+
+    async def logout_all(self, req: RefreshToken) -> UserSuccess:
+        ended_sessions = await self.session_service.end_all(req.refresh_token)
+        if ended_sessions is None:
+            message = MESSAGES["AUTH"]["TOKEN_ERROR"]
+            self.logger.info(
+                {
+                    "activity_type": ACTIVITY_TYPES["USER_LOGOUT"],
+                    "message": message,
+                    "metadata": {},
+                }
+            )
+            return {"is_success": False, "message": message}
+
+        message = MESSAGES["AUTH"]["LOGGED_OUT_ALL"]
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["USER_LOGOUT"],
+                "message": message,
+                "metadata": {"sessions": ended_sessions},
+            }
+        )
+        return {"is_success": True, "message": message}
+
+    async def validate_tokens(self, req: BatchJWT) -> list[TokenValidation]:
+        # Duplicate tokens in a batch are verified once
+        unique_tokens = list(dict.fromkeys(req.tokens))
+        verified = await asyncio.gather(
+            *(self.verify_token(token) for token in unique_tokens)
+        )
+        data_by_token = dict(zip(unique_tokens, verified, strict=True))
+
+        results: list[TokenValidation] = [
+            {"is_valid": data_by_token[token] is not None, "data": data_by_token[token]}
+            for token in req.tokens
+        ]
+
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["VALIDATE_TOKEN"],
+                "message": MESSAGES["AUTH"]["TOKENS_VALIDATED"],
+                "metadata": {
+                    "total": len(results),
+                    "valid": sum(result["is_valid"] for result in results),
+                },
+            }
+        )
+        return results
+
     async def change_password(
         self, id: str, req: ChangeUserPasswordRequest
     ) -> UserSuccess:
-        existing_user = await UserRepository.find_by_id(id)
+        existing_user = await UserRepository.find_credentials_by_id(id)
         old_password = req.old_password
         new_password = req.new_password
 
@@ -302,9 +381,24 @@ class AuthService:
             return {"is_success": False, "message": message}
 
         new_password_hash = await self.utility_service.hash_string(new_password)
-        await UserRepository.update_by_user(
-            existing_user, {"password": new_password_hash}
+        # Lost to a concurrent change, the old password is no longer current
+        is_changed = await UserRepository.update_password_if(
+            existing_user, new_password_hash
         )
+        if not is_changed:
+            message = MESSAGES["USER"]["INCORRECT_PASSWORD"]
+            self.logger.warn(
+                {
+                    "activity_type": ACTIVITY_TYPES["CHANGE_PASSWORD"],
+                    "message": message,
+                    "metadata": {"user": {"id": id}},
+                }
+            )
+            return {"is_success": False, "message": message}
+
+        # Sessions opened with the old password must not outlive it
+        await self.session_service.end_for_user(str(existing_user.id))
+
         message = MESSAGES["USER"]["PASSWORD_CHANGED"]
         self.logger.info(
             {
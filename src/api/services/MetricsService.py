@@ -0,0 +1,22 @@
+from src.utils.svcs import Service
+from src.api.typing.Metrics import Metrics
+from src.api.repositories._pool import pool_stats
+from src.config.databases.postgres import PG_REPLICAS
+from src.api.repositories._identity import identity_map_stats
+from src.api.repositories.UserRepository import user_cache
+
+from .UtilityService import token_cache, hash_executor, revocation_list
+
+
+@Service()
+class MetricsService:
+    def collect(self) -> Metrics:
+        return {
+            "hashing": hash_executor.stats(),
+            "token_cache": token_cache.stats(),
+            "revocation": revocation_list.stats(),
+            "user_cache": user_cache.stats(),
+            "identity_map": identity_map_stats,
+            "pg_pool": pool_stats("pg"),
+            "pg_replica_pools": {alias: pool_stats(alias) for alias in PG_REPLICAS},
+        }
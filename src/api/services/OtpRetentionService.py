@@ -0,0 +1,60 @@
+from typing import Annotated
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+
+from src.env import otp
+from src.utils.svcs import Service, ADepends
+from src.utils.tasks import PeriodicTask
+from src.utils.logger import Logger
+from src.api.constants.messages import MESSAGES
+from src.api.constants.activity_types import ACTIVITY_TYPES
+from src.api.repositories.OtpRepository import OtpRepository
+
+# Never purge a code that could still be redeemed
+OTP_RETENTION = timedelta(minutes=max(otp["retention"], otp["lifetime"]))
+
+
+@Service()
+class OtpRetentionService:
+    def __init__(self, logger: Annotated[Logger, "OtpRetentionService"]) -> None:
+        self.logger = logger
+
+    async def purge(self) -> int:
+        cutoff = timezone.now() - OTP_RETENTION
+
+        # Dropping whole partitions first leaves few rows for the batched delete
+        dropped = await OtpRepository.maintain_partitions(
+            cutoff, otp["partition_days_ahead"]
+        )
+        deleted = await OtpRepository.delete_created_before(
+            cutoff, otp["purge_batch_size"]
+        )
+
+        if deleted or dropped:
+            self.logger.info(
+                {
+                    "activity_type": ACTIVITY_TYPES["PURGE_OTPS"],
+                    "message": MESSAGES["OTP"]["PURGED"],
+                    "metadata": {
+                        "cutoff": cutoff.isoformat(),
+                        "deleted": deleted,
+                        "dropped_partitions": dropped,
+                    },
+                }
+            )
+        return deleted
+
+
+def run_otp_retention() -> None:
+    async def run() -> None:
+        retention_service = await ADepends(OtpRetentionService)
+        await retention_service.purge()
+
+    async_to_sync(run)()
+
+
+otp_retention_task = PeriodicTask(
+    "otp-retention", otp["purge_interval"], run_otp_retention
+)
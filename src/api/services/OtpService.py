@@ -1,19 +1,27 @@
 from typing import Annotated
 from datetime import timedelta
 
+from django.utils import timezone
+
 from src.env import otp
 from src.utils.svcs import Service
 from src.utils.logger import Logger
+from src.api.models.postgres import User, UserStatus
 from src.api.typing.OTPSuccess import OTPSuccess
 from src.api.constants.messages import MESSAGES
 from src.api.constants.activity_types import ACTIVITY_TYPES
 from src.api.repositories.OtpRepository import OtpRepository
 from src.api.repositories.UserRepository import UserRepository
+from src.api.repositories.RedisOtpRepository import RedisOtpRepository
 
 from .UtilityService import UtilityService
 
 OTP_LIFETIME = timedelta(minutes=otp["lifetime"])
 
+otp_repository: type[OtpRepository] | type[RedisOtpRepository] = (
+    RedisOtpRepository if otp["backend"] == "redis" else OtpRepository
+)
+
 
 @Service()
 class OtpService:
@@ -24,7 +32,7 @@ class OtpService:
         self.utility_service = utility_service
 
     async def send_otp(self, user_id: str) -> OTPSuccess:
-        existing_user = await UserRepository.find_by_id(user_id)
+        existing_user = await UserRepository.find_public_by_id(user_id)
         if not existing_user:
             message = MESSAGES["USER"]["DOESNT_EXIST"]
             self.logger.warn(
@@ -47,12 +55,12 @@ class OtpService:
             )
             return {"is_success": False, "message": message}
 
-        otp = await OtpRepository.find_valid_user_key(existing_user, OTP_LIFETIME)
+        otp = await otp_repository.find_valid_user_key(existing_user, OTP_LIFETIME)
         if not otp:
             key = self.utility_service.generate_random_string(
                 length=6, numeric_only=True
             )
-            otp = await OtpRepository.add(key, existing_user)
+            otp = await otp_repository.add(key, existing_user)
 
         otp  # Process the otp notification to the user
 
@@ -66,34 +74,27 @@ class OtpService:
         )
         return {"is_success": True, "message": message}
 
-    async def validate_otp(self, user_id: str, key: str) -> bool:
-        user = await UserRepository.find_by_id(user_id)
-        if not user:
-            self.logger.error(
-                {
-                    "activity_type": ACTIVITY_TYPES["VALIDATE_OTP"],
-                    "message": MESSAGES["USER"]["DOESNT_EXIST"],
-                    "metadata": {"user": {"id": user_id}},
-                }
-            )
-            return False
-
-        otp = await OtpRepository.find_valid_user_key(user, OTP_LIFETIME)
-        if not otp:
-            self.logger.info(
-                {
-                    "activity_type": ACTIVITY_TYPES["VALIDATE_OTP"],
-                    "message": MESSAGES["OTP"]["VALIDATE_FAIL"],
-                    "metadata": {"user": {"id": user_id}, "key": key},
-                }
+    async def redeem_otp(self, email: str, key: str, flags: UserStatus) -> User | None:
+        """Consume the user's OTP and set status `flags` on the user atomically."""
+        if otp_repository is OtpRepository:
+            # One statement: the OTP delete and the user update commit together
+            user = await UserRepository.update_by_otp(
+                email, key, timezone.now() - OTP_LIFETIME, flags
             )
-            return False
+        else:
+            user = await UserRepository.find_by_email(email)
+            if user and await otp_repository.consume_user_key(user, key, OTP_LIFETIME):
+                await UserRepository.add_status(user, flags)
+            else:
+                user = None
 
         self.logger.info(
             {
                 "activity_type": ACTIVITY_TYPES["VALIDATE_OTP"],
-                "message": MESSAGES["OTP"]["VALIDATE_SUCCESS"],
-                "metadata": {"user": {"id": user_id}, "key": key},
+                "message": MESSAGES["OTP"][
+                    "VALIDATE_SUCCESS" if user else "VALIDATE_FAIL"
+                ],
+                "metadata": {"email": email, "key": key},
             }
         )
-        return True
+        return user
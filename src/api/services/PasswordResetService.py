@@ -14,6 +14,7 @@ from src.api.models.payload.requests.PasswordResetRequest import (
     ConfirmPasswordResetRequest,
 )
 
+from .SessionService import SessionService
 from .UtilityService import UtilityService
 
 
@@ -22,9 +23,11 @@ class PasswordResetService:
     def __init__(
         self,
         logger: Annotated[Logger, "PasswordResetService"],
+        session_service: SessionService,
         utility_service: UtilityService,
     ) -> None:
         self.logger = logger
+        self.session_service = session_service
         self.utility_service = utility_service
 
     async def request_password_reset(self, req: PasswordResetRequest) -> UserSuccess:
@@ -144,6 +147,8 @@ class PasswordResetService:
         await UserRepository.update_by_user(
             existing_user, {"password": new_password_hash}
         )
+        # Whoever triggered the reset may hold the account's sessions
+        await self.session_service.end_for_user(str(existing_user.id))
         message = MESSAGES["PASSWORD_RESET"]["PASSWORD_RESET"]
         self.logger.info(
             {
@@ -0,0 +1,78 @@
+import time
+import asyncio
+from uuid import uuid4
+from typing import Annotated
+
+from src.env import jwt_config
+from src.utils.svcs import Service
+from src.utils.logger import Logger
+from src.utils.sessions import Session, SessionStore
+from src.api.typing.Session import SessionTokens
+from src.config.caches.redis import REDIS
+
+from .UtilityService import UtilityService
+
+session_store = SessionStore(
+    url=REDIS["LOCATION"],
+    prefix=REDIS["KEY_PREFIX"],
+    lifetime=jwt_config["refresh_token_lifetime"],
+)
+
+
+@Service()
+class SessionService:
+    def __init__(
+        self,
+        logger: Annotated[Logger, "SessionService"],
+        utility_service: UtilityService,
+    ) -> None:
+        self.logger = logger
+        self.utility_service = utility_service
+
+    async def start(self, email: str, user_id: str) -> SessionTokens:
+        jti = uuid4().hex
+        token = self.utility_service.generate_jwt(email, user_id, jti)
+        refresh_token = await session_store.create(
+            {
+                "user_id": user_id,
+                "email": email,
+                "access_jti": jti,
+                "access_expires_at": time.time() + jwt_config["access_token_lifetime"],
+            }
+        )
+        return {"token": token, "refresh_token": refresh_token}
+
+    async def refresh(self, refresh_token: str) -> SessionTokens | None:
+        session = await session_store.consume(refresh_token)
+        if not session:
+            return None
+        return await self.start(session["email"], session["user_id"])
+
+    async def end(self, refresh_token: str) -> bool:
+        session = await session_store.consume(refresh_token)
+        if not session:
+            return False
+
+        await self.revoke_access(session)
+        return True
+
+    async def end_all(self, refresh_token: str) -> int | None:
+        session = await session_store.consume(refresh_token)
+        if not session:
+            return None
+
+        ended, _ = await asyncio.gather(
+            self.end_for_user(session["user_id"]), self.revoke_access(session)
+        )
+        return ended + 1
+
+    async def end_for_user(self, user_id: str) -> int:
+        """End every session of a user and revoke their live access tokens."""
+        sessions = await session_store.consume_all(user_id)
+        await asyncio.gather(*(self.revoke_access(session) for session in sessions))
+        return len(sessions)
+
+    async def revoke_access(self, session: Session) -> None:
+        await self.utility_service.revoke_jti(
+            session["access_jti"], session["access_expires_at"]
+        )
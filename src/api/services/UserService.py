@@ -0,0 +1,76 @@
+from uuid import UUID
+from typing import Annotated
+from datetime import date
+
+from src.utils.svcs import Service
+from src.utils.logger import Logger
+from src.api.typing.UserPage import UserPage
+from src.api.constants.messages import MESSAGES, DYNAMIC_MESSAGES
+from src.api.constants.activity_types import ACTIVITY_TYPES
+from src.api.repositories.UserRepository import UserRepository
+from src.api.models.payload.requests.ListUsersRequest import ListUsersRequest
+
+from .UtilityService import UtilityService
+
+USER_FILTERS = ("is_validated", "is_active", "is_enabled", "is_deleted")
+
+
+@Service()
+class UserService:
+    def __init__(
+        self,
+        logger: Annotated[Logger, "UserService"],
+        utility_service: UtilityService,
+    ) -> None:
+        self.logger = logger
+        self.utility_service = utility_service
+
+    async def list_users(self, req: ListUsersRequest) -> UserPage | None:
+        filters = {
+            name: value
+            for name in USER_FILTERS
+            if (value := getattr(req, name)) is not None
+        }
+
+        after = None
+        if req.cursor:
+            after = self.parse_cursor(req.cursor)
+            if not after:
+                self.logger.info(
+                    {
+                        "activity_type": ACTIVITY_TYPES["LIST_USERS"],
+                        "message": MESSAGES["USER"]["INVALID_CURSOR"],
+                        "metadata": {"cursor": req.cursor},
+                    }
+                )
+                return None
+
+        # One extra row tells whether another page exists
+        users = await UserRepository.list(filters, after=after, limit=req.limit + 1)
+        next_cursor = None
+        if len(users) > req.limit:
+            users = users[: req.limit]
+            last_user = users[-1]
+            next_cursor = self.utility_service.encode_cursor(
+                last_user.created_at.isoformat(), str(last_user.id)
+            )
+
+        self.logger.info(
+            {
+                "activity_type": ACTIVITY_TYPES["LIST_USERS"],
+                "message": DYNAMIC_MESSAGES["COMMON"]["FETCHED_SUCCESS"]("Users"),
+                "metadata": {"filters": filters, "count": len(users)},
+            }
+        )
+        return {"users": users, "next_cursor": next_cursor}
+
+    def parse_cursor(self, cursor: str) -> tuple[date, UUID] | None:
+        values = self.utility_service.decode_cursor(cursor)
+        if not values or len(values) != 2:
+            return None
+
+        created_at, id = values
+        try:
+            return date.fromisoformat(created_at), UUID(id)
+        except ValueError:
+            return None
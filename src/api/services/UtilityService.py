@@ -1,53 +1,116 @@
 import hmac
+import math
+import time
 import hashlib
 from uuid import uuid4
-from base64 import b64encode
-from typing import TypedDict
+from base64 import b64encode, urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, TypedDict, NotRequired
 from datetime import UTC, datetime, timedelta
+from contextlib import suppress
 
 import jwt
-import bcrypt
 from faker import Faker
 from django.utils import timezone
 from ninja.errors import AuthenticationError
+from django.core.cache import cache
 
-from src.env import jwt_config
+from src.env import queue, hashing, jwt_config, api_gateway
+from src.utils.jwks import KeyRing
 from src.utils.svcs import Service
+from src.utils.cache import LRUCache
 from src.utils.logger import Logger
+from src.utils.hashers import (
+    BCryptHasher,
+    ScryptHasher,
+    PasswordHasher,
+    PasswordHasherRegistry,
+)
 from src.api.typing.JWT import JWTData
-from src.api.models.postgres import User
+from src.utils.executor import BoundedExecutor
+from src.utils.revocation import RevocationList
+from src.utils.signatures import SignatureError, SignatureVerifier
+from src.api.models.postgres import User, PublicUser, UserCredentials
+from src.config.caches.redis import REDIS
 from src.api.typing.ExpireUUID import ExpireUUID
 from src.api.enums.CharacterCasing import CharacterCasing
 
 DEFAULT_CHARACTER_LENGTH = 12
+JWT_CACHE_PREFIX = "jwt"
 fake = Faker()
 
+token_cache: LRUCache[JWTData] = LRUCache(max_entries=jwt_config["cache_size"])
+
+key_ring = KeyRing(jwt_config["algorithm"], jwt_config["signing_keys"])
+
+revocation_list = RevocationList(
+    url=REDIS["LOCATION"],
+    prefix=REDIS["KEY_PREFIX"],
+    capacity=jwt_config["revocation_capacity"],
+    error_rate=jwt_config["revocation_error_rate"],
+    rebuild_interval=jwt_config["revocation_rebuild_interval"],
+    fail_open=jwt_config["revocation_fail_open"],
+)
+
+password_hashers = PasswordHasherRegistry(
+    [
+        BCryptHasher(rounds=hashing["bcrypt_rounds"]),
+        ScryptHasher(
+            n=hashing["scrypt_n"], r=hashing["scrypt_r"], p=hashing["scrypt_p"]
+        ),
+    ],
+    default=hashing["algorithm"],
+)
+
+hash_executor = BoundedExecutor(
+    name="hashing",
+    kind="process" if hashing["executor"] == "process" else "thread",
+    workers=hashing["workers"],
+    queue_size=hashing["queue_size"],
+    timeout=hashing["timeout"],
+)
+
+
+# Signature TTLs are configured in minutes
+gateway_signature_verifier = SignatureVerifier(
+    api_gateway["key"], ttl=api_gateway["ttl"] * 60
+)
+queue_signature_verifier = SignatureVerifier(queue["key"], ttl=queue["ttl"] * 60)
+
 
 class SignatureData(TypedDict):
     title: str
     signature: str
     timestamp: str
-    key: str
-    ttl: int | float
+    verifier: SignatureVerifier
+    allow_replay: NotRequired[bool]
 
 
 @Service()
 class UtilityService:
     @staticmethod
-    async def hash_string(input: str) -> str:
+    async def hash_string(input: str, hasher: PasswordHasher | None = None) -> str:
         if not input:
             return ""
 
-        salt: bytes = bcrypt.gensalt(10)
-        hashed_string: bytes = bcrypt.hashpw(input.encode(), salt)
+        hashed_string: str = await hash_executor.run(
+            (hasher or password_hashers.default).hash, input
+        )
 
-        return hashed_string.decode()
+        return hashed_string
 
     @staticmethod
     async def compare_hash(input: str, hash: str) -> bool:
-        is_same = bcrypt.checkpw(input.encode(), hash.encode())
+        hasher = password_hashers.identify(hash)
+        if not hasher:
+            return False
+
+        is_same = await hash_executor.run(hasher.verify, input, hash)
         return is_same
 
+    @staticmethod
+    def needs_rehash(hash: str) -> bool:
+        return password_hashers.needs_rehash(hash)
+
     @staticmethod
     def generate_random_string(
         length: int = DEFAULT_CHARACTER_LENGTH,
@@ -73,35 +136,148 @@ class UtilityService:
                 return string
 
     @staticmethod
-    def sanitize_user_object(user: User | None = None) -> User:  # type: ignore
-        if user:
-            del user.password
-
-            return user
+    def sanitize_user_object(user: User | UserCredentials) -> PublicUser:
+        # A copy; the user may be shared through the identity map or cache
+        return PublicUser.of(user)
 
     @staticmethod
-    def generate_jwt(email: str, user_uuid: str) -> str:
+    def generate_jwt(email: str, user_uuid: str, jti: str | None = None) -> str:
         jwt_data = {"email": email, "user_id": user_uuid}
         jwt_claims = {
-            "exp": timezone.now() + timedelta(seconds=3600),
+            "jti": jti or uuid4().hex,
+            "exp": timezone.now()
+            + timedelta(seconds=jwt_config["access_token_lifetime"]),
             "iss": jwt_config["issuer"],
             "aud": jwt_config["issuer"],
         }
-        return jwt.encode(dict(jwt_data, **jwt_claims), jwt_config["secret"])
+        payload = dict(jwt_data, **jwt_claims)
+        if key_ring.is_enabled:
+            return jwt.encode(
+                payload,
+                key_ring.signing_key,  # type: ignore
+                algorithm=key_ring.algorithm,
+                headers={"kid": key_ring.signing_kid},
+            )
+        return jwt.encode(payload, jwt_config["secret"])
 
     @staticmethod
-    def decrypt_jwt(token: str) -> JWTData | None:
+    def get_jwt_verification_key(header: dict) -> Any | None:  # noqa: ANN401
+        algorithm = header.get("alg")
+        if key_ring.is_enabled and algorithm == key_ring.algorithm:
+            return key_ring.get_verification_key(header.get("kid"))
+        # Symmetric tokens stay valid while the shared secret is configured
+        if algorithm == "HS256" and jwt_config["secret"]:
+            return jwt_config["secret"]
+        return None
+
+    @staticmethod
+    def get_jwks() -> dict:
+        return key_ring.jwks()
+
+    @staticmethod
+    def token_digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    @staticmethod
+    def verify_jwt(token: str) -> tuple[JWTData, float] | None:
         try:
+            header = jwt.get_unverified_header(token)
+            key = UtilityService.get_jwt_verification_key(header)
+            if key is None:
+                return None
+
             data = jwt.decode(
                 token,
-                jwt_config["secret"],
-                algorithms=["HS256"],
+                key,
+                algorithms=[header["alg"]],
                 issuer=jwt_config["issuer"],
                 audience=jwt_config["issuer"],
+                options={"require": ["exp"]},
             )
-            return {"email": data["email"], "user_id": data["user_id"]}
         except jwt.exceptions.InvalidTokenError:
-            ...
+            return None
+
+        jwt_data: JWTData = {"email": data["email"], "user_id": data["user_id"]}
+        if "jti" in data:
+            jwt_data["jti"] = data["jti"]
+        return jwt_data, float(data["exp"])
+
+    @staticmethod
+    def get_verified_jwt(token: str) -> JWTData | None:
+        digest = UtilityService.token_digest(token)
+        data = token_cache.get(digest)
+        if data is not None:
+            return data
+
+        verified = UtilityService.verify_jwt(token)
+        if not verified:
+            return None
+
+        data, expires_at = verified
+        token_cache.set(digest, data, expires_at)
+        return data
+
+    @staticmethod
+    async def aget_verified_jwt(token: str) -> JWTData | None:
+        if not jwt_config["cache_redis"]:
+            return UtilityService.get_verified_jwt(token)
+
+        digest = UtilityService.token_digest(token)
+        data = token_cache.get(digest)
+        if data is not None:
+            return data
+
+        cache_key = f"{JWT_CACHE_PREFIX}:{digest.hex()}"
+        try:
+            cached = await cache.aget(cache_key)
+        except Exception:
+            # An unreachable cache only costs a local verification
+            cached = None
+        if cached:
+            token_cache.set(digest, cached["data"], cached["expires_at"])
+            return cached["data"]
+
+        verified = UtilityService.verify_jwt(token)
+        if not verified:
+            return None
+
+        data, expires_at = verified
+        token_cache.set(digest, data, expires_at)
+        with suppress(Exception):
+            await cache.aset(
+                cache_key,
+                {"data": data, "expires_at": expires_at},
+                timeout=math.ceil(expires_at - time.time()),
+            )
+        return data
+
+    @staticmethod
+    def decrypt_jwt(token: str) -> JWTData | None:
+        data = UtilityService.get_verified_jwt(token)
+        if data and "jti" in data and revocation_list.is_revoked(data["jti"]):
+            return None
+        return data
+
+    @staticmethod
+    async def adecrypt_jwt(token: str) -> JWTData | None:
+        data = await UtilityService.aget_verified_jwt(token)
+        if data and "jti" in data and await revocation_list.ais_revoked(data["jti"]):
+            return None
+        return data
+
+    @staticmethod
+    async def revoke_jwt(token: str) -> bool:
+        verified = UtilityService.verify_jwt(token)
+        if not verified or "jti" not in verified[0]:
+            return False
+
+        data, expires_at = verified
+        await UtilityService.revoke_jti(data["jti"], expires_at)
+        return True
+
+    @staticmethod
+    async def revoke_jti(jti: str, expires_at: float) -> None:
+        await revocation_list.revoke(jti, expires_at)
 
     @staticmethod
     def generate_uuid() -> ExpireUUID:
@@ -124,39 +300,36 @@ class UtilityService:
     def verify_signature(signature_data: SignatureData, logger: Logger) -> bool:
         signature = signature_data["signature"]
         timestamp = signature_data["timestamp"]
-        key = signature_data["key"]
-        ttl = signature_data["ttl"]
         title = signature_data["title"]
 
-        valid_signature = UtilityService.generate_signature(key, timestamp)
-        is_valid = hmac.compare_digest(valid_signature, signature)
-
-        if not is_valid:
-            message = "Invalid signature!"
-            logger.error(
-                {
-                    "activity_type": f"Authenticate {title} Request",
-                    "message": message,
-                    "metadata": {"signature": signature},
-                }
+        try:
+            signature_data["verifier"].verify(
+                signature, timestamp, signature_data.get("allow_replay", False)
             )
-            raise AuthenticationError(message=message)
-
-        initial_time = datetime.fromtimestamp(float(timestamp), UTC)
-        valid_window = initial_time + timedelta(minutes=ttl)
-        if valid_window < datetime.now(UTC):
-            message = "Signature expired!"
+        except SignatureError as exc:
+            message = str(exc)
             logger.error(
                 {
                     "activity_type": f"Authenticate {title} Request",
                     "message": message,
-                    "metadata": {"timestamp": timestamp},
+                    "metadata": {"signature": signature, "timestamp": timestamp},
                 }
             )
-            raise AuthenticationError(message=message)
+            raise AuthenticationError(message=message) from None
 
         return True
 
+    @staticmethod
+    def encode_cursor(*values: str) -> str:
+        return urlsafe_b64encode("\x1f".join(values).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> list[str] | None:
+        try:
+            return urlsafe_b64decode(cursor.encode()).decode().split("\x1f")
+        except (ValueError, UnicodeDecodeError):
+            return None
+
     @staticmethod
     def get_timestamp() -> str:
         current_time = datetime.now(UTC).timestamp()
@@ -4,9 +4,15 @@ from typing import TypedDict, NotRequired
 class JWTData(TypedDict):
     email: str
     user_id: str
+    jti: NotRequired[str]
 
 
 class JWTSuccess(TypedDict):
     is_success: bool
     message: str
     data: NotRequired[JWTData]
+
+
+class TokenValidation(TypedDict):
+    is_valid: bool
+    data: JWTData | None
@@ -0,0 +1,18 @@
+from typing import TypedDict
+
+from src.utils.cache import CacheStats
+from src.utils.executor import ExecutorStats
+from src.utils.revocation import RevocationStats
+from src.api.repositories._pool import PoolStats
+from src.api.repositories._cache import ModelCacheStats
+from src.api.repositories._identity import IdentityMapStats
+
+
+class Metrics(TypedDict):
+    hashing: ExecutorStats
+    token_cache: CacheStats
+    revocation: RevocationStats
+    user_cache: ModelCacheStats
+    identity_map: IdentityMapStats
+    pg_pool: PoolStats
+    pg_replica_pools: dict[str, PoolStats]
@@ -0,0 +1,6 @@
+from typing import TypedDict
+
+
+class SessionTokens(TypedDict):
+    token: str
+    refresh_token: str
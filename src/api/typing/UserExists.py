@@ -1,9 +1,9 @@
-from typing import TypedDict
+from typing import TypedDict, NotRequired
 
-from src.api.models.postgres import User
+from src.api.models.postgres import PublicUser
 
 
 class UserExists(TypedDict):
     is_exists: bool
-    user: User
+    user: NotRequired[PublicUser]
     message: str
@@ -0,0 +1,8 @@
+from typing import TypedDict
+
+from src.api.models.postgres import PublicUser
+
+
+class UserPage(TypedDict):
+    users: list[PublicUser]
+    next_cursor: str | None
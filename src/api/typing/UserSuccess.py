@@ -1,10 +1,11 @@
 from typing import TypedDict, NotRequired
 
-from src.api.models.postgres import User
+from src.api.models.postgres import PublicUser
 
 
 class UserSuccess(TypedDict):
     is_success: bool
     message: NotRequired[str]
-    user: NotRequired[User]
+    user: NotRequired[PublicUser]
     token: NotRequired[str]
+    refresh_token: NotRequired[str]
@@ -6,6 +6,7 @@ from ninja.errors import ValidationError, AuthenticationError
 
 from src.api.routes import api
 from src.utils.logger import Logger
+from src.utils.executor import ExecutorRejectedError
 from src.api.constants.messages import MESSAGES
 from src.api.constants.activity_types import ACTIVITY_TYPES
 
@@ -54,6 +55,27 @@ def on_validation_error(request: HttpRequest, exc: ValidationError) -> HttpRespo
     )
 
 
+@api.exception_handler(ExecutorRejectedError)
+def on_server_busy(request: HttpRequest, exc: Exception) -> HttpResponse:
+    exception_logger.warn(
+        {
+            "activity_type": ACTIVITY_TYPES["EXCEPTION"],
+            "message": str(exc),
+            "metadata": {"exception": exc.__class__},
+        }
+    )
+    response = api.create_response(
+        request,
+        error_response(
+            message=MESSAGES["COMMON"]["SERVER_BUSY"],
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        )[1],
+        status=HTTPStatus.SERVICE_UNAVAILABLE,
+    )
+    response["Retry-After"] = "1"
+    return response
+
+
 @api.exception_handler(Exception)
 def on_server_error(request: HttpRequest, exc: Exception) -> HttpResponse:
     exception_logger.error(
@@ -32,10 +32,61 @@ def setup_broker_middlewares() -> None:
     broker.add_middleware(PublishMiddleware)
 
 
+def shutdown_executors() -> None:
+    from src.api.services.UtilityService import hash_executor
+
+    hash_executor.shutdown()
+
+
+def start_token_revocation_sync() -> None:
+    from src.api.services.UtilityService import revocation_list
+
+    # Tokens are checked against the snapshot from the first request on
+    revocation_list.start()
+
+
+def stop_token_revocation_sync() -> None:
+    from src.api.services.UtilityService import revocation_list
+
+    revocation_list.stop()
+
+
+def start_otp_retention() -> None:
+    from src.api.services.OtpRetentionService import otp_retention_task
+
+    otp_retention_task.start()
+
+
+def stop_otp_retention() -> None:
+    from src.api.services.OtpRetentionService import otp_retention_task
+
+    otp_retention_task.stop()
+
+
+def close_database_pools() -> None:
+    from django.db import connections
+
+    from src.config.databases.postgres import PG_REPLICAS
+
+    for alias in ["pg", *PG_REPLICAS]:
+        connections[alias].close_pool()  # type: ignore
+
+
 application = Starlette(
     routes=[Mount("/", get_asgi_application())],  # type: ignore
-    on_startup=[setup_broker_middlewares, broker.start],
-    on_shutdown=[broker.close],
+    on_startup=[
+        setup_broker_middlewares,
+        start_token_revocation_sync,
+        start_otp_retention,
+        broker.start,
+    ],
+    on_shutdown=[
+        broker.close,
+        shutdown_executors,
+        stop_token_revocation_sync,
+        stop_otp_retention,
+        close_database_pools,
+    ],
 )
 
 
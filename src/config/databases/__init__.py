@@ -1,9 +1,10 @@
 from .mongo import MONGO
-from .postgres import POSTGRES
+from .postgres import POSTGRES, PG_REPLICAS
 
 DATABASES = {
     "default": {},
     "pg": POSTGRES,
+    **PG_REPLICAS,
     "mongo": MONGO,
 }
 
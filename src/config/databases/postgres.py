@@ -1,15 +1,48 @@
 from src.env import db, env
 
 pg = db["pg"]
+pool = db["pg_pool"]
+replicas = db["pg_replicas"]
 
-POSTGRES = {
-    "NAME": pg["database"],
-    "ENGINE": "django.db.backends.postgresql",
-    "USER": pg["user"],
-    "PASSWORD": pg["pass"],
-    "HOST": pg["host"],
-    "PORT": pg["port"],
-    "OPTIONS": {
-        "sslmode": "require" if (not env.isLocal and not env.isTest) else "prefer",
-    },
+POOL_OPTIONS = {
+    "min_size": pool["min_size"],
+    "max_size": pool["max_size"],
+    "max_lifetime": pool["max_lifetime"],
+    "max_idle": pool["max_idle"],
+    "timeout": pool["timeout"],
+}
+
+
+def postgres(alias: str, host: str | int, port: str | int) -> dict:
+    return {
+        "NAME": pg["database"],
+        "ENGINE": "django.db.backends.postgresql",
+        "USER": pg["user"],
+        "PASSWORD": pg["pass"],
+        "HOST": host,
+        "PORT": port,
+        # A pooled connection goes back to the pool when the request ends, so
+        # it must not also persist; without a pool, connections are reused
+        # for CONN_MAX_AGE seconds instead of redoing the TLS handshake
+        "CONN_MAX_AGE": 0 if pool["enabled"] else pool["conn_max_age"],
+        "CONN_HEALTH_CHECKS": pool["health_checks"],
+        "OPTIONS": {
+            "sslmode": "require" if (not env.isLocal and not env.isTest) else "prefer",
+            **({"pool": {"name": alias, **POOL_OPTIONS}} if pool["enabled"] else {}),
+        },
+    }
+
+
+POSTGRES = postgres("pg", pg["host"], pg["port"])
+
+# Replicas share the primary's credentials; tests read through the primary
+PG_REPLICAS = {
+    f"pg_replica_{index}": {
+        **postgres(f"pg_replica_{index}", host, port or pg["port"]),
+        "TEST": {"MIRROR": "pg"},
+    }
+    for index, (host, _, port) in enumerate(
+        (entry.strip().partition(":") for entry in replicas["hosts"] if entry.strip()),
+        start=1,
+    )
 }
@@ -1,20 +1,111 @@
+import re
+import time
+from itertools import cycle
+from contextvars import ContextVar
+from collections.abc import Callable
+
+from django.db import connections
 from django.db.models import Model
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from src.env import db
+
+from .postgres import PG_REPLICAS
+
+PRIMARY = "pg"
+
+# How long after a write reads stay on the primary; 0 without replicas
+STICKY_WINDOW = db["pg_replicas"]["sticky_window"] if PG_REPLICAS else 0.0
+
+# Monotonic time until which reads in this context go to the primary
+primary_until: ContextVar[float] = ContextVar("primary_until", default=0.0)
+
+
+# Statements that change rows, including data-modifying CTEs
+WRITE_STATEMENT = re.compile(
+    r"\s*(?:INSERT|UPDATE|DELETE|WITH\b.*\b(?:INSERT|UPDATE|DELETE)\b)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def stick_to_primary() -> None:
+    """Send this context's reads to the primary for the sticky window."""
+    if STICKY_WINDOW:
+        primary_until.set(time.monotonic() + STICKY_WINDOW)
+
+
+def stick_after_writes(
+    execute: Callable, sql: str, params: object, many: bool, context: dict
+) -> object:
+    """Execute wrapper for the primary: a write makes this context sticky."""
+    if WRITE_STATEMENT.match(sql):
+        stick_to_primary()
+    return execute(sql, params, many, context)
+
+
+def track_writes(
+    sender: type, connection: BaseDatabaseWrapper, **kwargs: object
+) -> None:
+    """connection_created receiver installing `stick_after_writes`."""
+    if (
+        STICKY_WINDOW
+        and connection.alias == PRIMARY
+        and stick_after_writes not in connection.execute_wrappers
+    ):
+        connection.execute_wrappers.append(stick_after_writes)
 
 
 class DatabaseRouter:
     """
     Router to route models to their respective databases
+
+    Postgres reads are spread over the replicas, except inside a transaction
+    and for the sticky window after a write, where they must see the primary.
+
+    The window is per context: it starts when a write statement runs on the
+    primary and covers the rest of that request. Other requests only see it
+    for users, through the user cache markers (see ModelCache). Reads that
+    look for a row an earlier request wrote in order to write again, such as
+    OTP and reset token checks, name the primary themselves.
     """
 
+    def __init__(self) -> None:
+        self.replicas = list(PG_REPLICAS)
+        self.routing = db["pg_replicas"]["routing"]
+        self._turns = cycle(range(len(self.replicas) or 1))
+
     def db_for_read(self, model: Model, **hints: dict) -> str:
         if model._meta.app_label == "mongo":
             return "mongo"
-        return "pg"
+        if (
+            not self.replicas
+            or primary_until.get() > time.monotonic()
+            or connections[PRIMARY].in_atomic_block
+        ):
+            return PRIMARY
+        return self.pick_replica()
 
     def db_for_write(self, model: Model, **hints: dict) -> str:
         if model._meta.app_label == "mongo":
             return "mongo"
-        return "pg"
+        return PRIMARY
+
+    def pick_replica(self) -> str:
+        # Rotating the starting point spreads ties in least_loaded too
+        turn = next(self._turns)
+        replicas = self.replicas[turn:] + self.replicas[:turn]
+        if self.routing != "least_loaded":
+            return replicas[0]
+        return min(replicas, key=self.load)
+
+    @staticmethod
+    def load(alias: str) -> int:
+        """Connections checked out of, or waiting on, the replica's pool."""
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            return 0
+        stats = pool.get_stats()
+        return stats["pool_size"] - stats["pool_available"] + stats["requests_waiting"]
 
     def allow_relation(self, obj1: Model, obj2: Model, **hints: dict) -> bool:
         # Allow relations if both models are in the same database
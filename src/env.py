@@ -1,7 +1,13 @@
 from typing import TypedDict
 
 from src import __name__, __version__, __description__, __display_name__
-from src.utils.env import get_env_int, get_env_str, get_env_list, get_env_float
+from src.utils.env import (
+    get_env_int,
+    get_env_str,
+    get_env_bool,
+    get_env_list,
+    get_env_float,
+)
 
 
 class Env:
@@ -32,22 +38,72 @@ class Log(TypedDict):
     level: str
 
 
+class DBPool(TypedDict):
+    enabled: bool
+    min_size: int
+    max_size: int
+    max_lifetime: float
+    max_idle: float
+    timeout: float
+    health_checks: bool
+    conn_max_age: int
+
+
+class DBReplicas(TypedDict):
+    hosts: list[str]
+    routing: str
+    sticky_window: float
+
+
 class DB(TypedDict):
     mongo: dict[str, str | int]
     pg: dict[str, str | int]
+    pg_pool: DBPool
+    pg_replicas: DBReplicas
 
 
 class Cache(TypedDict):
     redis: dict[str, str | int]
+    user_ttl: int
 
 
 class JWT(TypedDict):
     secret: str
     issuer: str
+    algorithm: str
+    access_token_lifetime: int
+    refresh_token_lifetime: int
+    signing_keys: list[str]
+    jwks_max_age: int
+    cache_size: int
+    cache_redis: bool
+    revocation_capacity: int
+    revocation_error_rate: float
+    revocation_rebuild_interval: int
+    revocation_fail_open: bool
+
+
+class Hashing(TypedDict):
+    algorithm: str
+    bcrypt_rounds: int
+    scrypt_n: int
+    scrypt_r: int
+    scrypt_p: int
+    login_budget_ms: float
+    executor: str
+    workers: int
+    queue_size: int
+    timeout: float
 
 
 class OTP(TypedDict):
+    backend: str
     lifetime: int
+    max_attempts: int
+    retention: int
+    purge_interval: float
+    purge_batch_size: int
+    partition_days_ahead: int
 
 
 class RabbitMQ(TypedDict):
@@ -68,6 +124,10 @@ class CORS(TypedDict):
     allowed_origins: list[str]
 
 
+class Admin(TypedDict):
+    user_ids: list[str]
+
+
 env = Env()
 
 app: App = {
@@ -99,6 +159,21 @@ db: DB = {
         "pass": get_env_str("PG_PASSWORD"),
         "database": get_env_str("PG_DATABASE"),
     },
+    "pg_pool": {
+        "enabled": get_env_bool("PG_POOL", default="True"),
+        "min_size": get_env_int("PG_POOL_MIN_SIZE", default="2"),
+        "max_size": get_env_int("PG_POOL_MAX_SIZE", default="10"),
+        "max_lifetime": get_env_float("PG_POOL_MAX_LIFETIME", default="3600"),
+        "max_idle": get_env_float("PG_POOL_MAX_IDLE", default="600"),
+        "timeout": get_env_float("PG_POOL_TIMEOUT", default="10"),
+        "health_checks": get_env_bool("PG_CONN_HEALTH_CHECKS", default="True"),
+        "conn_max_age": get_env_int("PG_CONN_MAX_AGE", default="60"),
+    },
+    "pg_replicas": {
+        "hosts": get_env_list("PG_REPLICA_HOSTS", default=""),
+        "routing": get_env_str("PG_READ_ROUTING", default="round_robin"),
+        "sticky_window": get_env_float("PG_PRIMARY_STICKY_WINDOW", default="5"),
+    },
 }
 
 cache: Cache = {
@@ -107,13 +182,51 @@ cache: Cache = {
         "port": get_env_int("REDIS_PORT"),
         "user": get_env_str("REDIS_USERNAME"),
         "pass": get_env_str("REDIS_PASSWORD"),
-    }
+    },
+    "user_ttl": get_env_int("USER_CACHE_TTL", default="300"),
 }
 
 
 jwt_config: JWT = {
-    "secret": get_env_str("JWT_SECRET"),
+    "secret": get_env_str("JWT_SECRET", default=""),
     "issuer": get_env_str("JWT_ISSUER"),
+    "algorithm": get_env_str("JWT_ALGORITHM", default="HS256"),
+    "access_token_lifetime": get_env_int("JWT_ACCESS_TOKEN_LIFETIME", default="900"),
+    "refresh_token_lifetime": get_env_int(
+        "JWT_REFRESH_TOKEN_LIFETIME", default="2592000"
+    ),
+    "signing_keys": get_env_list("JWT_SIGNING_KEYS", default=""),
+    "jwks_max_age": get_env_int("JWKS_MAX_AGE", default="300"),
+    "cache_size": get_env_int("JWT_CACHE_SIZE", default="10000"),
+    "cache_redis": get_env_bool("JWT_CACHE_REDIS", default="False"),
+    "revocation_capacity": get_env_int("JWT_REVOCATION_CAPACITY", default="100000"),
+    "revocation_error_rate": get_env_float(
+        "JWT_REVOCATION_ERROR_RATE", default="0.001"
+    ),
+    "revocation_rebuild_interval": get_env_int(
+        "JWT_REVOCATION_REBUILD_INTERVAL", default="300"
+    ),
+    "revocation_fail_open": get_env_bool("JWT_REVOCATION_FAIL_OPEN", default="True"),
+}
+
+# Signing with an empty secret would issue tokens that never verify
+if (
+    not any(path.strip() for path in jwt_config["signing_keys"])
+    and not jwt_config["secret"]
+):
+    raise ValueError("Set JWT_SIGNING_KEYS or JWT_SECRET to sign tokens")
+
+hashing: Hashing = {
+    "algorithm": get_env_str("PASSWORD_HASHER", default="bcrypt"),
+    "bcrypt_rounds": get_env_int("BCRYPT_ROUNDS", default="10"),
+    "scrypt_n": get_env_int("SCRYPT_N", default="16384"),
+    "scrypt_r": get_env_int("SCRYPT_R", default="8"),
+    "scrypt_p": get_env_int("SCRYPT_P", default="1"),
+    "login_budget_ms": get_env_float("LOGIN_LATENCY_BUDGET", default="250"),
+    "executor": get_env_str("HASH_EXECUTOR", default="thread"),
+    "workers": get_env_int("HASH_WORKERS", default="4"),
+    "queue_size": get_env_int("HASH_QUEUE_SIZE", default="64"),
+    "timeout": get_env_float("HASH_TIMEOUT", default="5"),
 }
 
 api_gateway: Gateway = {
@@ -126,19 +239,37 @@ queue: Queue = {
     "ttl": get_env_float("QUEUE_SECRET_KEY_TTL"),
 }
 
-otp: OTP = {"lifetime": get_env_int("OTP_LIFETIME")}
+otp: OTP = {
+    "backend": get_env_str("OTP_BACKEND", default="postgres"),
+    "lifetime": get_env_int("OTP_LIFETIME"),
+    "max_attempts": get_env_int("OTP_MAX_ATTEMPTS", default="5"),
+    "retention": get_env_int("OTP_RETENTION", default="1440"),
+    "purge_interval": get_env_float("OTP_PURGE_INTERVAL", default="300"),
+    "purge_batch_size": get_env_int("OTP_PURGE_BATCH_SIZE", default="5000"),
+    "partition_days_ahead": get_env_int("OTP_PARTITION_DAYS_AHEAD", default="7"),
+}
 
 rabbitmq_config: RabbitMQ = {"url": get_env_str("RABBITMQ_URL")}
 
 cors: CORS = {"allowed_origins": get_env_list("CORS_ALLOWED_ORIGINS")}
 
+admin: Admin = {
+    "user_ids": [
+        user_id.strip()
+        for user_id in get_env_list("ADMIN_USER_IDS", default="")
+        if user_id.strip()
+    ]
+}
+
 __all__ = [
+    "admin",
     "api_gateway",
     "app",
     "cache",
     "cors",
     "db",
     "env",
+    "hashing",
     "jwt_config",
     "log",
     "otp",
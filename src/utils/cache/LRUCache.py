@@ -0,0 +1,82 @@
+import time
+import threading
+from typing import Generic, TypeVar, TypedDict
+from collections import OrderedDict
+from collections.abc import Hashable
+
+T = TypeVar("T")
+
+
+class CacheStats(TypedDict):
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    expired: int
+    evictions: int
+    hit_ratio: float
+
+
+class LRUCache(Generic[T]):
+    """
+    Bounded in-process LRU cache whose entries expire at an absolute epoch time.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> T | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: T, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
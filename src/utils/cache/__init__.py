@@ -0,0 +1,3 @@
+from .LRUCache import LRUCache, CacheStats
+
+__all__ = ["CacheStats", "LRUCache"]
@@ -1,6 +1,7 @@
-from .env import get_env_int, get_env_str, get_env_list, get_env_float
+from .env import get_env_int, get_env_str, get_env_bool, get_env_list, get_env_float
 
 __all__ = [
+    "get_env_bool",
     "get_env_float",
     "get_env_int",
     "get_env_list",
@@ -30,6 +30,10 @@ def get_env_float(name: str, default: str | None = None) -> float:
     return float(get_env_variable(name, default=default, cast=float))
 
 
+def get_env_bool(name: str, default: str | None = None) -> bool:
+    return bool(get_env_variable(name, default=default, cast=bool))
+
+
 def get_env_list(name: str, sep: str = ",", default: str | None = None) -> list[str]:
     return list(
         get_env_variable(
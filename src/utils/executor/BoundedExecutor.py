@@ -0,0 +1,154 @@
+import time
+import asyncio
+import threading
+from typing import Any, Literal, TypeVar, TypedDict
+from collections.abc import Callable
+from concurrent.futures import Future, Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class ExecutorStats(TypedDict):
+    name: str
+    kind: str
+    workers: int
+    queue_size: int
+    in_flight: int
+    queue_depth: int
+    submitted: int
+    completed: int
+    rejected: int
+    timed_out: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class ExecutorRejectedError(Exception):
+    pass
+
+
+class ExecutorBusyError(ExecutorRejectedError):
+    pass
+
+
+class ExecutorTimeoutError(ExecutorRejectedError):
+    pass
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[float, T]:  # noqa: ANN401
+    # Runs inside the worker; the start time lets the caller derive queue wait.
+    return time.monotonic(), fn(*args)
+
+
+class BoundedExecutor:
+    """
+    Runs blocking callables on a dedicated pool without blocking the event loop.
+
+    At most `workers + queue_size` calls may be in flight; further calls are
+    rejected immediately with `ExecutorBusyError`, and calls that do not finish
+    within `timeout` seconds raise `ExecutorTimeoutError`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        queue_size: int,
+        timeout: float,
+        kind: ExecutorKind = "thread",
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.timeout = timeout
+
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so that forked server workers each get their own pool
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.workers, thread_name_prefix=self.name
+                        )
+        return self._executor
+
+    def _release(self, _: Future | None = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+        with self._lock:
+            if self._in_flight >= self.workers + self.queue_size:
+                self._rejected += 1
+                raise ExecutorBusyError(f"{self.name} executor queue is full")
+            self._in_flight += 1
+            self._submitted += 1
+
+        enqueued_at = time.monotonic()
+        try:
+            future = self._get_executor().submit(_timed_call, fn, *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            started_at, result = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout
+            )
+        except TimeoutError:
+            # Cancelling the wrapped future also drops the call if it never started
+            with self._lock:
+                self._timed_out += 1
+            raise ExecutorTimeoutError(
+                f"{self.name} call exceeded its {self.timeout}s deadline"
+            ) from None
+
+        wait = max(0.0, started_at - enqueued_at)
+        with self._lock:
+            self._completed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+        return result
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return {
+                "name": self.name,
+                "kind": self.kind,
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.workers),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_wait_ms": (self._total_wait / self._completed * 1000)
+                if self._completed
+                else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,17 @@
+from .BoundedExecutor import (
+    ExecutorKind,
+    ExecutorStats,
+    BoundedExecutor,
+    ExecutorBusyError,
+    ExecutorTimeoutError,
+    ExecutorRejectedError,
+)
+
+__all__ = [
+    "BoundedExecutor",
+    "ExecutorBusyError",
+    "ExecutorKind",
+    "ExecutorRejectedError",
+    "ExecutorStats",
+    "ExecutorTimeoutError",
+]
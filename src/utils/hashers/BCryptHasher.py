@@ -0,0 +1,33 @@
+import bcrypt
+
+from .PasswordHasher import PasswordHasher
+
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+class BCryptHasher(PasswordHasher):
+    """Encoded as the native modular crypt string, e.g. `$2b$10$<salt+hash>`."""
+
+    algorithm = "bcrypt"
+
+    def __init__(self, rounds: int = 10) -> None:
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(self.rounds)
+        return bcrypt.hashpw(password.encode(), salt).decode()
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode(), encoded.encode())
+        except ValueError:
+            return False
+
+    def identify(self, encoded: str) -> bool:
+        return encoded.startswith(BCRYPT_PREFIXES)
+
+    def needs_update(self, encoded: str) -> bool:
+        try:
+            return int(encoded.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
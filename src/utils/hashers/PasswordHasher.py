@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+
+class PasswordHasher(ABC):
+    """
+    A password hashing scheme whose encoded output carries its own algorithm
+    and parameters, so stored hashes stay verifiable after the policy changes.
+    """
+
+    algorithm: str
+
+    @abstractmethod
+    def hash(self, password: str) -> str: ...
+
+    @abstractmethod
+    def verify(self, password: str, encoded: str) -> bool: ...
+
+    @abstractmethod
+    def identify(self, encoded: str) -> bool: ...
+
+    @abstractmethod
+    def needs_update(self, encoded: str) -> bool: ...
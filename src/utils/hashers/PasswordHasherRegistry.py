@@ -0,0 +1,36 @@
+from collections.abc import Iterable
+
+from .PasswordHasher import PasswordHasher
+
+
+class PasswordHasherRegistry:
+    """
+    Verifies any registered scheme and hashes new passwords with the default
+    one; hashes produced under another scheme or other parameters are
+    reported by `needs_rehash` so they can be upgraded on the next login.
+    """
+
+    def __init__(self, hashers: Iterable[PasswordHasher], default: str) -> None:
+        self._hashers = {hasher.algorithm: hasher for hasher in hashers}
+        if default not in self._hashers:
+            raise ValueError(f"Unknown password hasher: {default}")
+        self.default = self._hashers[default]
+
+    def register(self, hasher: PasswordHasher) -> None:
+        self._hashers[hasher.algorithm] = hasher
+
+    def get(self, algorithm: str) -> PasswordHasher | None:
+        return self._hashers.get(algorithm)
+
+    def identify(self, encoded: str) -> PasswordHasher | None:
+        if self.default.identify(encoded):
+            return self.default
+        for hasher in self._hashers.values():
+            if hasher.identify(encoded):
+                return hasher
+        return None
+
+    def needs_rehash(self, encoded: str) -> bool:
+        if not self.default.identify(encoded):
+            return True
+        return self.default.needs_update(encoded)
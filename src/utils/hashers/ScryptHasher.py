@@ -0,0 +1,71 @@
+import hmac
+import base64
+import hashlib
+import secrets
+
+from .PasswordHasher import PasswordHasher
+
+SALT_BYTES = 16
+KEY_BYTES = 64
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class ScryptHasher(PasswordHasher):
+    """Encoded as `scrypt$<n>$<r>$<p>$<salt>$<hash>` with unpadded base64 parts."""
+
+    algorithm = "scrypt"
+
+    def __init__(self, n: int = 2**14, r: int = 8, p: int = 1) -> None:
+        self.n = n
+        self.r = r
+        self.p = p
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r * p,
+            dklen=KEY_BYTES,
+        )
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(SALT_BYTES)
+        key = self._derive(password, salt, self.n, self.r, self.p)
+        return "$".join(
+            [
+                self.algorithm,
+                str(self.n),
+                str(self.r),
+                str(self.p),
+                _b64encode(salt),
+                _b64encode(key),
+            ]
+        )
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            _, n, r, p, salt, key = encoded.split("$")
+            derived = self._derive(password, _b64decode(salt), int(n), int(r), int(p))
+            return hmac.compare_digest(derived, _b64decode(key))
+        except ValueError:
+            return False
+
+    def identify(self, encoded: str) -> bool:
+        return encoded.startswith(f"{self.algorithm}$")
+
+    def needs_update(self, encoded: str) -> bool:
+        try:
+            _, n, r, p, *_ = encoded.split("$")
+            return (int(n), int(r), int(p)) != (self.n, self.r, self.p)
+        except ValueError:
+            return True
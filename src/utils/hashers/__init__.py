@@ -0,0 +1,11 @@
+from .BCryptHasher import BCryptHasher
+from .ScryptHasher import ScryptHasher
+from .PasswordHasher import PasswordHasher
+from .PasswordHasherRegistry import PasswordHasherRegistry
+
+__all__ = [
+    "BCryptHasher",
+    "PasswordHasher",
+    "PasswordHasherRegistry",
+    "ScryptHasher",
+]
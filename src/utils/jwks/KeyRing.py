@@ -0,0 +1,87 @@
+import json
+import base64
+import hashlib
+from typing import Any
+from pathlib import Path
+from collections.abc import Iterable
+
+import jwt
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_public_key,
+    load_pem_private_key,
+)
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PublicKeyTypes,
+    PrivateKeyTypes,
+)
+
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "RS256")
+
+# RFC 7638 members hashed into the key thumbprint, per key type
+THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "OKP": ("crv", "kty", "x"),
+    "EC": ("crv", "kty", "x", "y"),
+}
+
+
+def _thumbprint(jwk: dict[str, Any]) -> str:
+    members = {name: jwk[name] for name in THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+class KeyRing:
+    """
+    Asymmetric JWT keys loaded from PEM files. The first file must hold the
+    private key used for signing; the remaining files (private or public)
+    are retired keys that stay published so already-issued tokens verify
+    until they expire. Every key is identified by its RFC 7638 thumbprint.
+    """
+
+    def __init__(self, algorithm: str, paths: Iterable[str]) -> None:
+        self.algorithm = algorithm
+        self.signing_kid: str | None = None
+        self.signing_key: PrivateKeyTypes | None = None
+        self._public_keys: dict[str, PublicKeyTypes] = {}
+        self._jwks: list[dict[str, Any]] = []
+
+        paths = [path.strip() for path in paths if path.strip()]
+        if not paths:
+            return
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported asymmetric JWT algorithm: {algorithm}")
+
+        jwt_algorithm = jwt.get_algorithm_by_name(algorithm)
+        for index, path in enumerate(paths):
+            pem = Path(path).read_bytes()
+            private_key = (
+                load_pem_private_key(pem, password=None) if b"PRIVATE" in pem else None
+            )
+            public_key = (
+                private_key.public_key() if private_key else load_pem_public_key(pem)
+            )  # type: ignore
+
+            jwk: dict[str, Any] = jwt_algorithm.to_jwk(public_key, as_dict=True)  # type: ignore
+            kid = _thumbprint(jwk)
+            self._public_keys[kid] = public_key
+            self._jwks.append({**jwk, "kid": kid, "alg": algorithm, "use": "sig"})
+
+            if index == 0:
+                if private_key is None:
+                    raise ValueError(f"Active JWT signing key is not private: {path}")
+                self.signing_kid = kid
+                self.signing_key = private_key
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.signing_key is not None
+
+    def get_verification_key(self, kid: str | None) -> PublicKeyTypes | None:
+        if kid is None:
+            return None
+        return self._public_keys.get(kid)
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        return {"keys": self._jwks}
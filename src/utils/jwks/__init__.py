@@ -0,0 +1,3 @@
+from .KeyRing import ASYMMETRIC_ALGORITHMS, KeyRing
+
+__all__ = ["ASYMMETRIC_ALGORITHMS", "KeyRing"]
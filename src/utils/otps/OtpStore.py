@@ -0,0 +1,90 @@
+import time
+from typing import TypedDict, cast
+from collections.abc import Awaitable
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.commands.core import AsyncScript
+
+from src.utils.redis import get_async_redis_client
+
+# Keep the live code if there is one, otherwise store the new one with a TTL
+ISSUE_SCRIPT = b"""
+local existing = redis.call('HMGET', KEYS[1], 'key', 'created_at')
+if existing[1] then
+    return existing
+end
+redis.call('HSET', KEYS[1], 'key', ARGV[1], 'created_at', ARGV[2], 'attempts', 0)
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return {ARGV[1], ARGV[2]}
+"""
+
+# 1: matched and deleted, 0: wrong code, -1: no code, -2: wrong code, attempts spent
+CONSUME_SCRIPT = b"""
+local key = redis.call('HGET', KEYS[1], 'key')
+if not key then
+    return -1
+end
+if key == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+    return -2
+end
+return 0
+"""
+
+
+class StoredOtp(TypedDict):
+    key: str
+    created_at: float
+
+
+class OtpStore:
+    """One live OTP per user, kept in a Redis hash that expires with the code.
+
+    Issuing and consuming run as Lua scripts, so concurrent requests cannot
+    issue two codes for a user or redeem one code twice. A code is deleted
+    once it is redeemed or after `max_attempts` wrong guesses.
+    """
+
+    def __init__(self, url: str, prefix: str, lifetime: int, max_attempts: int) -> None:
+        self.url = url
+        self.lifetime = lifetime
+        self.max_attempts = max_attempts
+        self.key_prefix = f"{prefix}:otp:"
+
+        # Clients are per event loop, so every call passes its own
+        self.issue_script = AsyncScript(None, ISSUE_SCRIPT)  # type: ignore
+        self.consume_script = AsyncScript(None, CONSUME_SCRIPT)  # type: ignore
+
+    @property
+    def client(self) -> AsyncRedis:
+        return get_async_redis_client(self.url)
+
+    async def get(self, user_id: str) -> StoredOtp | None:
+        # redis-py types commands for its sync and async clients alike
+        key, created_at = await cast(
+            Awaitable[list[str | None]],
+            self.client.hmget(f"{self.key_prefix}{user_id}", ["key", "created_at"]),
+        )
+        if key is None or created_at is None:
+            return None
+        return {"key": key, "created_at": float(created_at)}
+
+    async def issue(self, user_id: str, key: str) -> StoredOtp:
+        stored_key, created_at = await self.issue_script(
+            keys=[f"{self.key_prefix}{user_id}"],
+            args=[key, repr(time.time()), self.lifetime * 1000],
+            client=self.client,
+        )
+        return {"key": stored_key, "created_at": float(created_at)}
+
+    async def consume(self, user_id: str, key: str) -> bool:
+        result = await self.consume_script(
+            keys=[f"{self.key_prefix}{user_id}"],
+            args=[key, self.max_attempts],
+            client=self.client,
+        )
+        return result == 1
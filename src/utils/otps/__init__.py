@@ -0,0 +1,3 @@
+from .OtpStore import OtpStore, StoredOtp
+
+__all__ = ["OtpStore", "StoredOtp"]
@@ -0,0 +1,3 @@
+from .clients import get_redis_client, get_async_redis_client
+
+__all__ = ["get_async_redis_client", "get_redis_client"]
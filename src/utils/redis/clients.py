@@ -0,0 +1,23 @@
+import asyncio
+from weakref import WeakKeyDictionary
+from functools import cache
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncRedis]] = (
+    WeakKeyDictionary()
+)
+
+
+@cache
+def get_redis_client(url: str) -> Redis:
+    return Redis.from_url(url, decode_responses=True)
+
+
+def get_async_redis_client(url: str) -> AsyncRedis:
+    # asyncio connections are bound to the loop that opened them
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if url not in clients:
+        clients[url] = AsyncRedis.from_url(url, decode_responses=True)
+    return clients[url]
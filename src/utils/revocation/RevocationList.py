@@ -0,0 +1,236 @@
+import math
+import time
+import threading
+from typing import TypedDict
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from src.utils.redis import get_redis_client, get_async_redis_client
+from src.utils.logger import Logger
+
+from .BloomFilter import BloomFilter
+
+# How long start() waits for the subscription before taking the snapshot
+SUBSCRIBE_TIMEOUT = 5.0
+
+
+class RevocationStats(TypedDict):
+    revoked: int
+    filter_bits: int
+    lookups: int
+    possible_hits: int
+    confirmed_hits: int
+
+
+class RevocationList:
+    """
+    Revoked token ids (`jti`) live in Redis until the token would have expired.
+    Each worker mirrors them in a Bloom filter, fed by a snapshot on start and
+    by pub/sub afterwards, so Redis is only asked about ids the filter flags.
+    The filter is rebuilt periodically to forget expired ids and to recover
+    from missed messages; ids that arrive while a rebuild scans are replayed
+    into the new filter.
+
+    Until `start()` has taken the first snapshot, every lookup is confirmed
+    with Redis. A lookup Redis cannot answer counts as revoked once the
+    filter is ready, since only filter hits get that far; before then,
+    `fail_open` decides, as failing closed would reject every token.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str,
+        capacity: int,
+        error_rate: float,
+        rebuild_interval: int,
+        fail_open: bool = True,
+    ) -> None:
+        self.url = url
+        self.key_prefix = f"{prefix}:revoked_jti:"
+        self.channel = f"{prefix}:revoked_jti"
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.fail_open = fail_open
+
+        self.logger = Logger("RevocationList")
+        self._filter = BloomFilter(capacity, error_rate)
+        self._filter_lock = threading.Lock()
+        # Ids added while a rebuild scans, None when no rebuild runs
+        self._pending: list[str] | None = None
+        self._ready = False
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopped = threading.Event()
+        self._subscribed = threading.Event()
+        self._lookups = 0
+        self._possible_hits = 0
+        self._confirmed_hits = 0
+
+    @property
+    def client(self) -> Redis:
+        return get_redis_client(self.url)
+
+    @property
+    def async_client(self) -> AsyncRedis:
+        return get_async_redis_client(self.url)
+
+    def start(self) -> None:
+        """Subscribe, then take the first snapshot before returning."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._stopped.clear()
+            self._subscribed.clear()
+
+        threading.Thread(
+            target=self._subscribe, name="revocation-sync", daemon=True
+        ).start()
+        # Ids revoked from here on arrive by pub/sub, so the snapshot misses none
+        self._subscribed.wait(SUBSCRIBE_TIMEOUT)
+        self._try_rebuild()
+        threading.Thread(
+            target=self._rebuild_loop, name="revocation-rebuild", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            self._started = False
+
+    def _add(self, jti: str) -> None:
+        with self._filter_lock:
+            self._filter.add(jti)
+            if self._pending is not None:
+                self._pending.append(jti)
+
+    def _rebuild(self) -> None:
+        with self._filter_lock:
+            self._pending = []
+        try:
+            prefix_length = len(self.key_prefix)
+            jtis = [
+                key[prefix_length:]
+                for key in self.client.scan_iter(
+                    match=f"{self.key_prefix}*", count=1000
+                )
+            ]
+            bloom = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+            for jti in jtis:
+                bloom.add(jti)
+            with self._filter_lock:
+                # The scan may have passed these keys before they were set
+                for jti in self._pending:
+                    bloom.add(jti)
+                self._filter = bloom
+        finally:
+            with self._filter_lock:
+                self._pending = None
+        self._ready = True
+
+    def _try_rebuild(self) -> None:
+        try:
+            self._rebuild()
+        except Exception as exc:
+            self.logger.error(
+                {
+                    "activity_type": "Sync revoked tokens",
+                    "message": str(exc),
+                    "metadata": {},
+                }
+            )
+
+    def _rebuild_loop(self) -> None:
+        # Retry soon while no snapshot has succeeded yet
+        while not self._stopped.wait(self.rebuild_interval if self._ready else 1.0):
+            self._try_rebuild()
+
+    def _subscribe(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                pubsub = self.client.pubsub()
+                pubsub.subscribe(self.channel)
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if not message:
+                        continue
+                    if message["type"] == "message":
+                        self._add(message["data"])
+                    elif message["type"] == "subscribe":
+                        # After a reconnect, catch up on what was published
+                        # while the connection was down
+                        if self._subscribed.is_set():
+                            self._try_rebuild()
+                        self._subscribed.set()
+                pubsub.close()
+            except Exception as exc:
+                self.logger.error(
+                    {
+                        "activity_type": "Sync revoked tokens",
+                        "message": str(exc),
+                        "metadata": {},
+                    }
+                )
+                self._stopped.wait(1.0)
+
+    def might_be_revoked(self, jti: str) -> bool:
+        self._lookups += 1
+        # Before the first snapshot the filter cannot rule anything out
+        if self._ready and jti not in self._filter:
+            return False
+        self._possible_hits += 1
+        return True
+
+    def _unconfirmed(self, jti: str, exc: Exception) -> bool:
+        revoked = self._ready or not self.fail_open
+        self.logger.error(
+            {
+                "activity_type": "Check revoked token",
+                "message": str(exc),
+                "metadata": {"jti": jti, "revoked": revoked},
+            }
+        )
+        return revoked
+
+    def is_revoked(self, jti: str) -> bool:
+        if not self.might_be_revoked(jti):
+            return False
+        try:
+            revoked = bool(self.client.exists(f"{self.key_prefix}{jti}"))
+        except Exception as exc:
+            revoked = self._unconfirmed(jti, exc)
+        self._confirmed_hits += revoked
+        return revoked
+
+    async def ais_revoked(self, jti: str) -> bool:
+        if not self.might_be_revoked(jti):
+            return False
+        try:
+            revoked = bool(await self.async_client.exists(f"{self.key_prefix}{jti}"))
+        except Exception as exc:
+            revoked = self._unconfirmed(jti, exc)
+        self._confirmed_hits += revoked
+        return revoked
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        ttl = math.ceil(expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        async with self.async_client.pipeline(transaction=True) as pipe:
+            pipe.set(f"{self.key_prefix}{jti}", 1, ex=ttl)
+            pipe.publish(self.channel, jti)
+            await pipe.execute()
+        self._add(jti)
+
+    def stats(self) -> RevocationStats:
+        return {
+            "revoked": self._filter.count,
+            "filter_bits": self._filter.size,
+            "lookups": self._lookups,
+            "possible_hits": self._possible_hits,
+            "confirmed_hits": self._confirmed_hits,
+        }
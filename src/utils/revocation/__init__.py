@@ -0,0 +1,4 @@
+from .BloomFilter import BloomFilter
+from .RevocationList import RevocationList, RevocationStats
+
+__all__ = ["BloomFilter", "RevocationList", "RevocationStats"]
@@ -0,0 +1,41 @@
+from django.test import SimpleTestCase
+
+from src.utils.revocation import BloomFilter
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_added_items_are_always_found(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_empty_filter_finds_nothing(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+
+        self.assertNotIn("jti-0", bloom)
+
+    def test_false_positives_stay_near_the_error_rate(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        self.assertLess(false_positives / 10000, 0.03)
+
+    def test_size_follows_capacity_and_error_rate(self) -> None:
+        small, large = BloomFilter(1000, 0.01), BloomFilter(1000, 0.001)
+
+        self.assertEqual(small.size, 9586)
+        self.assertEqual(small.hash_count, 7)
+        self.assertGreater(large.size, small.size)
+
+    def test_capacity_below_one_still_holds_an_item(self) -> None:
+        bloom = BloomFilter(0, 0.01)
+        bloom.add("jti")
+
+        self.assertIn("jti", bloom)
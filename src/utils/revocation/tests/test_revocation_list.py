@@ -0,0 +1,121 @@
+from unittest import mock
+from collections.abc import Iterator
+
+from django.test import SimpleTestCase
+
+from src.utils.revocation import RevocationList
+
+PREFIX = "test:revoked_jti:"
+
+
+def make_revocation_list(fail_open: bool = True) -> RevocationList:
+    return RevocationList(
+        url="redis://localhost:6379/0",
+        prefix="test",
+        capacity=100,
+        error_rate=0.01,
+        rebuild_interval=300,
+        fail_open=fail_open,
+    )
+
+
+class RevocationListTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.redis = mock.MagicMock()
+        self.redis.scan_iter.return_value = [f"{PREFIX}revoked"]
+        self.redis.exists.side_effect = lambda key: int(key == f"{PREFIX}revoked")
+        self.async_redis = mock.MagicMock()
+        self.async_redis.exists = mock.AsyncMock(
+            side_effect=lambda key: int(key == f"{PREFIX}revoked")
+        )
+        for name, client in (
+            ("client", self.redis),
+            ("async_client", self.async_redis),
+        ):
+            patcher = mock.patch.object(
+                RevocationList, name, new_callable=mock.PropertyMock
+            )
+            patcher.start().return_value = client
+            self.addCleanup(patcher.stop)
+
+    def test_lookup_does_not_start_syncing(self) -> None:
+        revocation_list = make_revocation_list()
+
+        revocation_list.is_revoked("revoked")
+
+        self.assertFalse(revocation_list._started)
+
+    def test_every_lookup_goes_to_redis_before_the_snapshot(self) -> None:
+        revocation_list = make_revocation_list()
+
+        self.assertTrue(revocation_list.is_revoked("revoked"))
+        self.assertFalse(revocation_list.is_revoked("valid"))
+        self.assertEqual(self.redis.exists.call_count, 2)
+
+    def test_filter_misses_skip_redis_after_the_snapshot(self) -> None:
+        revocation_list = make_revocation_list()
+        revocation_list._rebuild()
+
+        self.assertFalse(revocation_list.is_revoked("valid"))
+        self.assertTrue(revocation_list.is_revoked("revoked"))
+        self.redis.exists.assert_called_once_with(f"{PREFIX}revoked")
+
+    def test_unreachable_redis_fails_open_before_the_snapshot(self) -> None:
+        self.redis.exists.side_effect = ConnectionError("Redis is down")
+        revocation_list = make_revocation_list()
+
+        self.assertFalse(revocation_list.is_revoked("revoked"))
+
+    def test_unreachable_redis_fails_closed_when_configured(self) -> None:
+        self.redis.exists.side_effect = ConnectionError("Redis is down")
+        revocation_list = make_revocation_list(fail_open=False)
+
+        self.assertTrue(revocation_list.is_revoked("valid"))
+
+    def test_unreachable_redis_fails_closed_on_filter_hits(self) -> None:
+        revocation_list = make_revocation_list()
+        revocation_list._rebuild()
+        self.redis.exists.side_effect = ConnectionError("Redis is down")
+
+        self.assertTrue(revocation_list.is_revoked("revoked"))
+
+    def test_ids_added_during_a_rebuild_are_kept(self) -> None:
+        revocation_list = make_revocation_list()
+
+        def scan_iter(**kwargs: object) -> Iterator[str]:
+            yield f"{PREFIX}revoked"
+            # Published after the scan passed where its key would be
+            revocation_list._add("late")
+
+        self.redis.scan_iter.side_effect = scan_iter
+        revocation_list._rebuild()
+
+        self.assertTrue(revocation_list.might_be_revoked("late"))
+        self.assertIsNone(revocation_list._pending)
+
+    def test_stats_count_lookups_and_hits(self) -> None:
+        revocation_list = make_revocation_list()
+        revocation_list._rebuild()
+
+        revocation_list.is_revoked("valid")
+        revocation_list.is_revoked("revoked")
+
+        stats = revocation_list.stats()
+        self.assertEqual(stats["revoked"], 1)
+        self.assertEqual(stats["lookups"], 2)
+        self.assertEqual(stats["possible_hits"], 1)
+        self.assertEqual(stats["confirmed_hits"], 1)
+
+    async def test_async_lookups_go_through_the_filter(self) -> None:
+        revocation_list = make_revocation_list()
+        revocation_list._rebuild()
+
+        self.assertFalse(await revocation_list.ais_revoked("valid"))
+        self.assertTrue(await revocation_list.ais_revoked("revoked"))
+        self.async_redis.exists.assert_awaited_once_with(f"{PREFIX}revoked")
+
+    async def test_async_lookups_fail_open_before_the_snapshot(self) -> None:
+        self.async_redis.exists.side_effect = ConnectionError("Redis is down")
+        revocation_list = make_revocation_list()
+
+        self.assertFalse(await revocation_list.ais_revoked("revoked"))
@@ -0,0 +1,95 @@
+import json
+import hashlib
+import secrets
+from typing import TypedDict, cast
+from collections.abc import Awaitable
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.commands.core import AsyncScript
+
+from src.utils.redis import get_async_redis_client
+
+# Empty the user's index and take every session in it in one step, so a
+# session created meanwhile is either consumed here or indexed afterwards
+CONSUME_ALL_SCRIPT = b"""
+local digests = redis.call('SMEMBERS', KEYS[1])
+redis.call('DEL', KEYS[1])
+local sessions = {}
+for _, digest in ipairs(digests) do
+    local value = redis.call('GETDEL', ARGV[1] .. digest)
+    if value then
+        table.insert(sessions, value)
+    end
+end
+return sessions
+"""
+
+
+class Session(TypedDict):
+    user_id: str
+    email: str
+    access_jti: str
+    access_expires_at: float
+
+
+class SessionStore:
+    """Opaque refresh tokens kept in Redis, indexed per user.
+
+    Only a digest of each token is stored. Consuming a token deletes it
+    atomically (GETDEL), so a refresh token can be rotated exactly once.
+    Consuming all of a user's sessions runs as a Lua script for the same reason.
+    """
+
+    def __init__(self, url: str, prefix: str, lifetime: int) -> None:
+        self.url = url
+        self.lifetime = lifetime
+        self.key_prefix = f"{prefix}:refresh_token:"
+        self.user_prefix = f"{prefix}:user_sessions:"
+
+        # Clients are per event loop, so every call passes its own
+        self.consume_all_script = AsyncScript(None, CONSUME_ALL_SCRIPT)  # type: ignore
+
+    @property
+    def client(self) -> AsyncRedis:
+        return get_async_redis_client(self.url)
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def create(self, session: Session) -> str:
+        token = secrets.token_urlsafe(32)
+        digest = self.digest(token)
+        user_key = f"{self.user_prefix}{session['user_id']}"
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(
+                f"{self.key_prefix}{digest}", json.dumps(session), ex=self.lifetime
+            )
+            pipe.sadd(user_key, digest)
+            pipe.expire(user_key, self.lifetime)
+            await pipe.execute()
+        return token
+
+    async def consume(self, token: str) -> Session | None:
+        digest = self.digest(token)
+        value = await self.client.getdel(f"{self.key_prefix}{digest}")
+        if value is None:
+            return None
+
+        session: Session = json.loads(value)
+        # redis-py types commands for its sync and async clients alike
+        await cast(
+            Awaitable[int],
+            self.client.srem(f"{self.user_prefix}{session['user_id']}", digest),
+        )
+        return session
+
+    async def consume_all(self, user_id: str) -> list[Session]:
+        values = await self.consume_all_script(
+            keys=[f"{self.user_prefix}{user_id}"],
+            args=[self.key_prefix],
+            client=self.client,
+        )
+        # Entries that already expired are skipped by the script
+        return [json.loads(value) for value in values]
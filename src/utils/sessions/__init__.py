@@ -0,0 +1,3 @@
+from .SessionStore import Session, SessionStore
+
+__all__ = ["Session", "SessionStore"]
@@ -0,0 +1,81 @@
+import hmac
+import math
+import time
+import hashlib
+from base64 import b64encode
+
+REPLAY_BUCKETS = 8
+
+
+class SignatureError(Exception):
+    pass
+
+
+class InvalidSignatureError(SignatureError):
+    pass
+
+
+class ExpiredSignatureError(SignatureError):
+    pass
+
+
+class ReplayedSignatureError(SignatureError):
+    pass
+
+
+class SignatureVerifier:
+    """Verifies `HMAC-SHA256(key, "<key>:<timestamp>")` signatures.
+
+    The keyed HMAC state is built once and copied per call. Accepted
+    signatures are remembered per process in buckets of timestamp seconds;
+    buckets that fall out of the validity window are dropped, so memory is
+    bounded by the request rate times the window.
+    """
+
+    def __init__(self, key: str, ttl: float, max_skew: int = 5) -> None:
+        self.ttl = math.ceil(ttl)
+        self.max_skew = max_skew
+        self._hmac = hmac.new(key.encode(), f"{key}:".encode(), hashlib.sha256)
+        self._bucket_width = max(1, math.ceil((self.ttl + max_skew) / REPLAY_BUCKETS))
+        self._seen: dict[int, set[str]] = {}
+        self._oldest_bucket = 0
+
+    def sign(self, timestamp: str) -> str:
+        mac = self._hmac.copy()
+        mac.update(timestamp.encode())
+        return b64encode(mac.digest()).decode()
+
+    def verify(
+        self, signature: str, timestamp: str, allow_replay: bool = False
+    ) -> None:
+        try:
+            issued_at = int(timestamp.partition(".")[0])
+        except ValueError:
+            raise InvalidSignatureError("Invalid signature!") from None
+
+        now = int(time.time())
+        if issued_at > now + self.max_skew:
+            raise InvalidSignatureError("Invalid signature!")
+        if issued_at < now - self.ttl:
+            raise ExpiredSignatureError("Signature expired!")
+
+        if not hmac.compare_digest(self.sign(timestamp), signature):
+            raise InvalidSignatureError("Invalid signature!")
+
+        self._prune((now - self.ttl) // self._bucket_width)
+        seen = self._seen.setdefault(issued_at // self._bucket_width, set())
+        if signature in seen and not allow_replay:
+            raise ReplayedSignatureError("Signature already used!")
+        seen.add(signature)
+
+    def _prune(self, oldest_bucket: int) -> None:
+        if oldest_bucket <= self._oldest_bucket:
+            return
+
+        self._oldest_bucket = oldest_bucket
+        for bucket in [bucket for bucket in self._seen if bucket < oldest_bucket]:
+            self._seen.pop(bucket, None)
+
+    @property
+    def tracked(self) -> int:
+        return sum(len(seen) for seen in self._seen.values())
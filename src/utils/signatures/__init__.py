@@ -0,0 +1,15 @@
+from .SignatureVerifier import (
+    SignatureError,
+    SignatureVerifier,
+    ExpiredSignatureError,
+    InvalidSignatureError,
+    ReplayedSignatureError,
+)
+
+__all__ = [
+    "ExpiredSignatureError",
+    "InvalidSignatureError",
+    "ReplayedSignatureError",
+    "SignatureError",
+    "SignatureVerifier",
+]
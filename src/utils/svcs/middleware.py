@@ -18,6 +18,9 @@ class ContainerMiddleware:
 
     async def __call__(self, request: HttpRequest) -> HttpResponse:
         with svcs_from(request):
-            context.request.set(request)
-            response = await self.get_response(request)
+            token = context.request.set(request)
+            try:
+                response = await self.get_response(request)
+            finally:
+                context.request.reset(token)
             return response
@@ -0,0 +1,57 @@
+import random
+import threading
+from collections.abc import Callable
+
+from django.db import close_old_connections
+
+from src.utils.logger import Logger
+
+
+class PeriodicTask:
+    """
+    Runs `target` every `interval` seconds on a daemon thread. The first run
+    is delayed by a random fraction of the interval so workers started
+    together do not all run at once.
+    """
+
+    def __init__(self, name: str, interval: float, target: Callable[[], None]) -> None:
+        self.name = name
+        self.interval = interval
+        self.target = target
+
+        self.logger = Logger(name)
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started or self.interval <= 0:
+                return
+            self._started = True
+            self._stopped.clear()
+
+        threading.Thread(target=self._loop, name=self.name, daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            self._started = False
+
+    def _loop(self) -> None:
+        self._stopped.wait(random.uniform(0, self.interval))  # noqa: S311
+        while not self._stopped.is_set():
+            close_old_connections()
+            try:
+                self.target()
+            except Exception as exc:
+                self.logger.error(
+                    {
+                        "activity_type": f"Run {self.name}",
+                        "message": str(exc),
+                        "metadata": {},
+                    }
+                )
+            finally:
+                close_old_connections()
+            self._stopped.wait(self.interval)
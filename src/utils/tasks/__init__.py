@@ -0,0 +1,3 @@
+from .PeriodicTask import PeriodicTask
+
+__all__ = ["PeriodicTask"]